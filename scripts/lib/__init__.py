@@ -2,8 +2,8 @@
 DSL-RS Test Runner Library
 """
 
-from .config_generator import ConfigGenerator
+from .config_generator import ConfigGenerator, ConfigMatrix
 from .test_executor import TestExecutor
 from .report_generator import ReportGenerator
 
-__all__ = ['ConfigGenerator', 'TestExecutor', 'ReportGenerator']
\ No newline at end of file
+__all__ = ['ConfigGenerator', 'ConfigMatrix', 'TestExecutor', 'ReportGenerator']
\ No newline at end of file
@@ -4,15 +4,272 @@ Generates test configurations from ranges and combinations.
 """
 
 import itertools
+import math
 import yaml
 import json
-from typing import Dict, List, Any, Union, Optional
+from typing import Dict, List, Any, Union, Optional, Sequence, Tuple, Iterable, Iterator, Callable, TYPE_CHECKING
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    from .json_utils import json_dumps, json_loads
+except ImportError:  # imported as a top-level module, with scripts/lib on sys.path
+    from json_utils import json_dumps, json_loads
+
+if TYPE_CHECKING:  # annotations only; see _numpy()
+    import numpy as np
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, preferring orjson."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def _save_yaml(path: Path, configurations: Iterable[Dict[str, Any]]) -> int:
+    """Stream configurations to a YAML list; returns the number written."""
+    count = 0
+    with open(path, 'w') as f:
+        # Each single-item list dumps as one "- key: value" block;
+        # concatenated they form the same document as the full list.
+        for config in configurations:
+            yaml.dump([config], f, Dumper=SafeDumper, default_flow_style=False)
+            count += 1
+        if not count:
+            yaml.dump([], f, Dumper=SafeDumper, default_flow_style=False)
+    return count
+
+
+def _save_json(path: Path, configurations: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream configurations to a JSON array; returns the number written.
+    
+    Each configuration is written compactly on its own line, which keeps
+    the file diffable and valid JSON without pretty-printing every value.
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        for config in configurations:
+            f.write(b',\n' if count else b'\n')
+            f.write(json_dumps(config))
+            count += 1
+        f.write(b'\n]\n' if count else b']\n')
+    return count
+
+
+# Dispatch on lowercased file suffix
+_LOADERS = {'.yaml': _load_yaml, '.yml': _load_yaml, '.json': _load_json}
+_SAVERS = {'.yaml': _save_yaml, '.yml': _save_yaml, '.json': _save_json}
+
+
+def _numpy():
+    """
+    Import numpy on first use.
+    
+    numpy is optional and only ConfigMatrix needs it, so importing this
+    module (e.g. for generate_matrix) does not pay for loading it.
+    """
+    import numpy  # cached in sys.modules after first use
+    return numpy
+
+
+def _object_array(values: Sequence[Any]) -> 'np.ndarray':
+    """Build a 1-D object array without numpy expanding nested sequences."""
+    np = _numpy()
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def _index_product(lengths: Sequence[int]) -> 'np.ndarray':
+    """
+    Cartesian product of ``range(n)`` for each length, computed in C.
+
+    Rows are ordered like ``itertools.product`` (last axis varies fastest).
+
+    Args:
+        lengths: Number of values along each axis
+
+    Returns:
+        Index matrix of shape (prod(lengths), len(lengths))
+    """
+    np = _numpy()
+    # Smallest unsigned type that can index the longest axis
+    max_card = max(lengths)
+    if max_card <= 2 ** 8:
+        dtype = np.uint8
+    elif max_card <= 2 ** 16:
+        dtype = np.uint16
+    else:
+        dtype = np.uint32
+    grid = np.indices(lengths, dtype=dtype)
+    return grid.reshape(len(lengths), -1).T
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize a scalar-or-list constraint operand to a list."""
+    return value if isinstance(value, list) else [value]
+
+
+def _as_set(value: Any) -> Union[frozenset, Tuple[Any, ...]]:
+    """Normalize an include/exclude operand for repeated membership tests."""
+    items = _as_list(value)
+    try:
+        return frozenset(items)
+    except TypeError:  # unhashable members; fall back to a linear scan
+        return tuple(items)
+
+
+def _value_passes(value: Any, constraint: Dict[str, Any]) -> bool:
+    """Check a single parameter value against a min/max/exclude/include constraint."""
+    if 'min' in constraint and not value >= constraint['min']:
+        return False
+    if 'max' in constraint and not value <= constraint['max']:
+        return False
+    if 'exclude' in constraint and value in _as_list(constraint['exclude']):
+        return False
+    if 'include' in constraint and value not in _as_list(constraint['include']):
+        return False
+    return True
+
+
+def _compile_constraints(constraints: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Generate a single straight-line predicate for a set of constraints.
+    
+    The source of ``_predicate`` is assembled from the constraint keys and
+    executed once, so filtering a configuration costs one function call
+    instead of one closure call per constrained key. Keys and operands are
+    bound as names in the function's namespace rather than spliced into the
+    source, so arbitrary values are safe.
+    
+    Unhashable values (e.g. lists) cannot be looked up in the include and
+    exclude sets; a configuration holding one is checked again by
+    ``_constraints_pass``, which compares values one by one.
+    
+    Args:
+        constraints: Dictionary of min/max/exclude/include constraints
+    
+    Returns:
+        Predicate returning True for configurations satisfying all constraints
+    """
+    namespace = {'_inf': float('inf'), '_slow': lambda config: _constraints_pass(config, constraints)}
+    terms = []
+    for i, (key, constraint) in enumerate(constraints.items()):
+        if not constraint:
+            continue
+        namespace[f'_k{i}'] = key
+        if 'min' in constraint:
+            namespace[f'_lo{i}'] = constraint['min']
+            terms.append(f'_get(_k{i}, 0) >= _lo{i}')
+        if 'max' in constraint:
+            namespace[f'_hi{i}'] = constraint['max']
+            terms.append(f'_get(_k{i}, _inf) <= _hi{i}')
+        if 'exclude' in constraint:
+            namespace[f'_ex{i}'] = _as_set(constraint['exclude'])
+            terms.append(f'_get(_k{i}) not in _ex{i}')
+        if 'include' in constraint:
+            namespace[f'_in{i}'] = _as_set(constraint['include'])
+            terms.append(f'_get(_k{i}) in _in{i}')
+    
+    body = ' and '.join(terms) if terms else 'True'
+    source = (f'def _predicate(config):\n'
+              f'    _get = config.get\n'
+              f'    try:\n'
+              f'        return {body}\n'
+              f'    except TypeError:\n'
+              f'        return _slow(config)\n')
+    exec(compile(source, '<filter_matrix>', 'exec'), namespace)
+    return namespace['_predicate']
+
+
+def _constraints_pass(config: Dict[str, Any], constraints: Dict[str, Any]) -> bool:
+    """Check a configuration against constraints without hashing its values."""
+    for key, constraint in constraints.items():
+        if not constraint:
+            continue
+        if key in config:
+            if not _value_passes(config[key], constraint):
+                return False
+        elif not _missing_key_passes(constraint):
+            return False
+    return True
+
+
+def _missing_key_passes(constraint: Dict[str, Any]) -> bool:
+    """Evaluate a constraint for a key absent from the configuration."""
+    if 'min' in constraint and not 0 >= constraint['min']:
+        return False
+    if 'max' in constraint and not float('inf') <= constraint['max']:
+        return False
+    if 'exclude' in constraint and None in _as_list(constraint['exclude']):
+        return False
+    if 'include' in constraint and None not in _as_list(constraint['include']):
+        return False
+    return True
+
+
+@dataclass
+class ConfigMatrix:
+    """
+    Configuration matrix stored as columns rather than one dict per row.
+    
+    ``index_matrix[i, j]`` is the position of row ``i``'s value for
+    ``keys[j]`` inside ``lookups[j]``. Iterating yields configuration
+    dictionaries, which are only built at that point.
+    """
+    keys: Tuple[str, ...]
+    lookups: List[Any]
+    index_matrix: Any
+    
+    def __len__(self) -> int:
+        return len(self.index_matrix)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.keys:
+            for _ in range(len(self)):
+                yield {}
+            return
+        keys = self.keys
+        for row in zip(*self._columns()):
+            yield dict(zip(keys, row))
+    
+    def _columns(self) -> List[List[Any]]:
+        """Gather each parameter's value column through the index matrix."""
+        return [lookup[self.index_matrix[:, j]].tolist() for j, lookup in enumerate(self.lookups)]
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a configuration dictionary."""
+        if not self.keys:
+            return [{} for _ in range(len(self))]
+        keys = self.keys
+        return [dict(zip(keys, row)) for row in zip(*self._columns())]
+    
+    def map_values(self, func: Callable[[Any], Any]) -> 'ConfigMatrix':
+        """Return a matrix sharing the same rows with every lookup value mapped through func."""
+        lookups = [_object_array([func(v) for v in lookup]) for lookup in self.lookups]
+        return ConfigMatrix(self.keys, lookups, self.index_matrix)
+
 
 class ConfigGenerator:
     """Generate test configuration matrices from specifications."""
     
+    __slots__ = ('base_config', '_range_cache')
+    
     def __init__(self, config_file: Optional[Path] = None):
         """
         Initialize the configuration generator.
@@ -21,18 +278,16 @@ class ConfigGenerator:
             config_file: Optional path to YAML/JSON configuration file
         """
         self.base_config = {}
+        self._range_cache: Dict[str, Tuple[Any, ...]] = {}
         if config_file and config_file.exists():
             self.load_config(config_file)
     
     def load_config(self, config_file: Path):
         """Load configuration from YAML or JSON file."""
-        with open(config_file, 'r') as f:
-            if config_file.suffix == '.yaml' or config_file.suffix == '.yml':
-                self.base_config = yaml.safe_load(f)
-            elif config_file.suffix == '.json':
-                self.base_config = json.load(f)
-            else:
-                raise ValueError(f"Unsupported config file format: {config_file.suffix}")
+        loader = _LOADERS.get(config_file.suffix.lower())
+        if loader is None:
+            raise ValueError(f"Unsupported config file format: {config_file.suffix}")
+        self.base_config = loader(config_file)
     
     def generate_range(self, spec: Union[Dict, List]) -> List[Any]:
         """
@@ -57,16 +312,42 @@ class ConfigGenerator:
                 if isinstance(start, int) and isinstance(stop, int):
                     return list(range(start, stop + 1, step))
                 elif isinstance(start, float) or isinstance(stop, float):
-                    values = []
-                    current = float(start)
-                    while current <= stop:
-                        values.append(current)
-                        current += step
+                    if step <= 0:
+                        raise ValueError(f"Range step must be positive: {step}")
+                    # Derive the count up front instead of accumulating
+                    # `current += step`, which drifts and can drop the endpoint.
+                    count = math.floor((stop - start) / step + 1e-9) + 1
+                    if count <= 0:
+                        return []
+                    # float() so e.g. start=0, step=1 still yields floats
+                    start, step = float(start), float(step)
+                    values = [start + step * i for i in range(count)]
+                    # The tolerance above admits an endpoint that rounding
+                    # pushed past stop (0.1 + 2 * 0.1 == 0.30000000000000004)
+                    values[-1] = min(values[-1], stop)
                     return values
             elif 'enum' in spec:
                 return spec['enum']
         return [spec]
     
+    def _generate_range_cached(self, spec: Union[Dict, List]) -> Tuple[Any, ...]:
+        """
+        Memoized ``generate_range`` keyed by the spec's canonical JSON form.
+        
+        Returns a tuple so the shared value list cannot be mutated by callers.
+        """
+        try:
+            key = json.dumps(spec, sort_keys=True)
+        except TypeError:
+            # Not JSON-serializable (e.g. a YAML date); skip the cache
+            return tuple(self.generate_range(spec))
+        
+        values = self._range_cache.get(key)
+        if values is None:
+            values = tuple(self.generate_range(spec))
+            self._range_cache[key] = values
+        return values
+    
     def generate_matrix(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Generate configuration matrix from parameter specifications.
@@ -77,31 +358,124 @@ class ConfigGenerator:
         Returns:
             List of configuration dictionaries
         """
+        return self._build_matrix(self._resolve_params(params))
+    
+    def generate_matrix_with_constraints(self,
+                                         params: Dict[str, Any],
+                                         constraints: Optional[Dict[str, Any]] = None,
+                                         filter_func: Optional[callable] = None) -> List[Dict[str, Any]]:
+        """
+        Generate a configuration matrix, pruning constrained values first.
+        
+        Constraints on a single parameter (min/max/include/exclude) are
+        applied to that parameter's value list before the Cartesian product
+        is taken, so rejected values never multiply into the matrix. Only
+        ``filter_func`` and constraints on keys outside ``params`` are left
+        to ``filter_matrix``.
+        
+        Args:
+            params: Dictionary of parameter names to range specifications
+            constraints: Optional dictionary of constraints
+            filter_func: Optional callable for cross-parameter filtering
+        
+        Returns:
+            List of configuration dictionaries
+        """
+        constraints = constraints or {}
+        configurations = self._build_matrix(self._resolve_params(params, constraints))
+        remaining = {key: c for key, c in constraints.items() if key not in params}
+        return self.filter_matrix(configurations, filter_func=filter_func, constraints=remaining)
+    
+    def _build_matrix(self, param_values: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+        """
+        Materialize the Cartesian product of resolved parameter values.
+        
+        Building every dictionary dominates here, so the list is made
+        straight from itertools.product; the index array behind ConfigMatrix
+        only pays off when rows are not all materialized.
+        """
+        # Generate all combinations
+        if not param_values:
+            return [{}]
+        
+        keys, values = zip(*param_values.items())
+        return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+    
+    def iter_matrix(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield the configuration matrix one dictionary at a time.
+        
+        Args:
+            params: Dictionary of parameter names to range specifications
+        
+        Yields:
+            Configuration dictionaries in ``generate_matrix`` order
+        """
+        param_values = self._resolve_params(params)
+        if not param_values:
+            yield {}
+            return
+        yield from self._iter_product(param_values)
+    
+    def _resolve_params(self,
+                        params: Dict[str, Any],
+                        constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Sequence[Any]]:
+        """Resolve every parameter specification to its list of values."""
         # Generate all possible values for each parameter
         param_values = {}
         for param, spec in params.items():
-            param_values[param] = self.generate_range(spec)
+            param_values[param] = self._generate_range_cached(spec)
+        
+        # Drop values rejected by single-parameter constraints
+        if constraints:
+            for param, constraint in constraints.items():
+                if constraint and param in param_values:
+                    param_values[param] = [v for v in param_values[param]
+                                           if _value_passes(v, constraint)]
         
         # Calculate total combinations
-        total = 1
-        for values in param_values.values():
-            total *= len(values)
+        total = math.prod(map(len, param_values.values()))
         
         print(f"Generating {total} configuration combinations")
+        return param_values
+    
+    def _iter_product(self, param_values: Dict[str, Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield configuration dictionaries via itertools.product."""
+        keys, values = zip(*param_values.items())
         
-        # Generate all combinations
-        if not param_values:
-            return [{}]
+        for combination in itertools.product(*values):
+            yield dict(zip(keys, combination))
+    
+    def generate_matrix_array(self, params: Dict[str, Any]) -> ConfigMatrix:
+        """
+        Generate configuration matrix as a compact index array.
         
-        keys = list(param_values.keys())
-        values = [param_values[k] for k in keys]
+        Each row of the index matrix holds, per parameter, the position of
+        its value in the matching lookup table. Dictionaries are only built
+        when rows are iterated, which keeps large matrices cheap.
         
-        configurations = []
-        for combination in itertools.product(*values):
-            config = dict(zip(keys, combination))
-            configurations.append(config)
+        Args:
+            params: Dictionary of parameter names to range specifications
         
-        return configurations
+        Returns:
+            ConfigMatrix holding the expanded combinations
+        """
+        try:
+            np = _numpy()
+        except ImportError:
+            raise ImportError("generate_matrix_array requires numpy") from None
+        
+        param_values = self._resolve_params(params)
+        if not param_values:
+            return ConfigMatrix((), [], np.zeros((1, 0), dtype=np.uint8))
+        return self._expand_to_array(param_values)
+    
+    def _expand_to_array(self, param_values: Dict[str, Sequence[Any]]) -> ConfigMatrix:
+        """Expand resolved parameter values into a ConfigMatrix."""
+        keys = tuple(param_values.keys())
+        lookups = [_object_array(param_values[k]) for k in keys]
+        index_matrix = _index_product([len(lookup) for lookup in lookups])
+        return ConfigMatrix(keys, lookups, index_matrix)
     
     def generate_env_matrix(self, env_specs: Dict[str, Any]) -> List[Dict[str, str]]:
         """
@@ -113,90 +487,154 @@ class ConfigGenerator:
         Returns:
             List of environment variable dictionaries
         """
-        configs = self.generate_matrix(env_specs)
-        # Convert all values to strings for environment variables
-        env_configs = []
-        for config in configs:
-            env_config = {k: str(v) for k, v in config.items()}
-            env_configs.append(env_config)
-        return env_configs
+        param_values = self._resolve_params(env_specs)
+        # Convert all values to strings for environment variables, once per
+        # distinct value rather than once per generated configuration
+        string_values = {k: [str(v) for v in values] for k, values in param_values.items()}
+        return self._build_matrix(string_values)
     
     def filter_matrix(self, 
-                     configurations: List[Dict[str, Any]], 
+                     configurations: Union[List[Dict[str, Any]], ConfigMatrix], 
                      filter_func: Optional[callable] = None,
-                     constraints: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                     constraints: Optional[Dict[str, Any]] = None) -> Union[List[Dict[str, Any]], ConfigMatrix]:
         """
         Filter configuration matrix based on constraints.
         
+        A ``ConfigMatrix`` is filtered with ``filter_matrix_array`` and stays
+        a ``ConfigMatrix``. ``filter_func`` is the slow path: it is called
+        from Python once per configuration dictionary.
+        
         Args:
-            configurations: List of configurations to filter
+            configurations: List of configurations (or a ConfigMatrix) to filter
             filter_func: Optional callable to filter configurations
             constraints: Optional dictionary of constraints
         
         Returns:
-            Filtered list of configurations
+            Filtered configurations, of the same kind as the input
         """
-        filtered = configurations
+        if isinstance(configurations, ConfigMatrix):
+            matrix = self.filter_matrix_array(configurations, constraints)
+            if filter_func:
+                keep = _numpy().fromiter((bool(filter_func(c)) for c in matrix), dtype=bool, count=len(matrix))
+                matrix = ConfigMatrix(matrix.keys, matrix.lookups, matrix.index_matrix[keep])
+            return matrix
+        
+        if not filter_func and not constraints:
+            return configurations
         
+        predicate = _compile_constraints(constraints or {})
+        
+        # Single pass: each configuration is visited once for all checks
         if filter_func:
-            filtered = [c for c in filtered if filter_func(c)]
+            return [c for c in configurations if filter_func(c) and predicate(c)]
+        return [c for c in configurations if predicate(c)]
+    
+    def filter_matrix_array(self,
+                            matrix: ConfigMatrix,
+                            constraints: Optional[Dict[str, Any]] = None) -> ConfigMatrix:
+        """
+        Filter a ConfigMatrix with a single boolean mask.
         
-        if constraints:
-            for key, constraint in constraints.items():
-                if 'min' in constraint:
-                    filtered = [c for c in filtered if c.get(key, 0) >= constraint['min']]
-                if 'max' in constraint:
-                    filtered = [c for c in filtered if c.get(key, float('inf')) <= constraint['max']]
-                if 'exclude' in constraint:
-                    excluded = constraint['exclude'] if isinstance(constraint['exclude'], list) else [constraint['exclude']]
-                    filtered = [c for c in filtered if c.get(key) not in excluded]
-                if 'include' in constraint:
-                    included = constraint['include'] if isinstance(constraint['include'], list) else [constraint['include']]
-                    filtered = [c for c in filtered if c.get(key) in included]
-        
-        return filtered
-    
-    def generate_test_scenarios(self) -> Dict[str, List[Dict[str, Any]]]:
+        Every constraint applies to one parameter, so it is evaluated once
+        per distinct value in that parameter's lookup table and the result
+        is gathered through the index column. Constraint semantics match
+        ``filter_matrix``.
+        
+        Args:
+            matrix: ConfigMatrix from ``generate_matrix_array``
+            constraints: Optional dictionary of constraints
+        
+        Returns:
+            ConfigMatrix restricted to the matching rows
+        """
+        if not constraints:
+            return matrix
+        
+        np = _numpy()
+        keys, lookups, index_matrix = matrix.keys, matrix.lookups, matrix.index_matrix
+        mask = np.ones(len(index_matrix), dtype=bool)
+        for key, constraint in constraints.items():
+            if key not in keys:
+                if not _missing_key_passes(constraint):
+                    mask[:] = False
+                continue
+            j = keys.index(key)
+            lookup = lookups[j]
+            allowed = np.fromiter((_value_passes(v, constraint) for v in lookup),
+                                  dtype=bool, count=len(lookup))
+            mask &= allowed[index_matrix[:, j]]
+        
+        return ConfigMatrix(keys, lookups, index_matrix[mask])
+    
+    def generate_test_scenarios(self) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
         """
         Generate test scenarios from base configuration.
         
+        Scenario matrices are expanded lazily: each value is a zero-argument
+        callable that builds that scenario's configurations when invoked, so
+        scenarios that are never run cost nothing. Use
+        ``generate_test_scenarios_materialized`` for the expanded lists.
+        
         Returns:
-            Dictionary of scenario names to configuration lists
+            Dictionary of scenario names to configuration list factories
         """
         if 'scenarios' not in self.base_config:
             return {}
         
-        scenarios = {}
-        for name, spec in self.base_config['scenarios'].items():
-            if 'matrix' in spec:
-                configs = self.generate_matrix(spec['matrix'])
-                if 'filter' in spec:
-                    configs = self.filter_matrix(configs, constraints=spec['filter'])
-                scenarios[name] = configs
-            elif 'configs' in spec:
-                scenarios[name] = spec['configs']
-            else:
-                scenarios[name] = [spec]
-        
-        return scenarios
-    
-    def save_matrix(self, configurations: List[Dict[str, Any]], output_file: Path):
+        return {name: (lambda spec=spec: self._scenario_configs(spec))
+                for name, spec in self.base_config['scenarios'].items()}
+    
+    def generate_test_scenarios_materialized(self, parallel: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate test scenarios with every configuration list expanded.
+        
+        Args:
+            parallel: Expand scenarios in separate processes. Only worth it
+                for several large matrices; process startup dominates otherwise.
+        
+        Returns:
+            Dictionary of scenario names to configuration lists
+        """
+        if not parallel:
+            return {name: factory() for name, factory in self.generate_test_scenarios().items()}
+        
+        specs = self.base_config.get('scenarios', {})
+        with ProcessPoolExecutor() as executor:
+            futures = {name: executor.submit(_expand_scenario, spec) for name, spec in specs.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
+    def _scenario_configs(self, spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Expand a single scenario specification into its configurations."""
+        if 'matrix' in spec:
+            return self.generate_matrix_with_constraints(spec['matrix'], constraints=spec.get('filter'))
+        elif 'configs' in spec:
+            return spec['configs']
+        return [spec]
+    
+    def save_matrix(self, configurations: Iterable[Dict[str, Any]], output_file: Path):
         """
         Save configuration matrix to file.
         
+        Configurations are written one at a time, so a generator such as
+        ``iter_matrix`` or a ``ConfigMatrix`` is never materialized as a
+        list of dictionaries.
+        
         Args:
-            configurations: List of configurations to save
+            configurations: Configurations to save (list, iterable or ConfigMatrix)
             output_file: Path to output file
         """
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            if output_file.suffix == '.yaml' or output_file.suffix == '.yml':
-                yaml.dump(configurations, f, default_flow_style=False)
-            else:
-                json.dump(configurations, f, indent=2)
+        # Anything that is not YAML is written as JSON
+        saver = _SAVERS.get(output_file.suffix.lower(), _save_json)
+        count = saver(output_file, configurations)
         
-        print(f"Saved {len(configurations)} configurations to {output_file}")
+        print(f"Saved {count} configurations to {output_file}")
+
+
+def _expand_scenario(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Expand one scenario in a worker process (module-level so it pickles)."""
+    return ConfigGenerator()._scenario_configs(spec)
 
 
 def create_default_matrix() -> Dict[str, Any]:
@@ -0,0 +1,38 @@
+"""
+JSON helpers for DSL-RS test runner.
+Uses orjson when it is installed and the stdlib json module otherwise.
+"""
+
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+    import json  # only loaded when orjson is missing
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from UTF-8 bytes or a string, preferring orjson."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, preferring orjson.
+    
+    Non-string dict keys are written as strings by both serializers.
+    
+    Args:
+        obj: Value to serialize
+        default: Optional hook for values the serializer cannot encode
+    
+    Returns:
+        The encoded JSON
+    """
+    if orjson is not None:
+        # orjson encodes datetimes itself, in the same ISO 8601 form as isoformat()
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=default, separators=(',', ':')).encode('utf-8')
@@ -3,377 +3,277 @@ Report generator for DSL-RS test runner.
 Generates HTML and JSON reports with detailed test results.
 """
 
-import json
-import html
+import re
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-import platform
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 import sys
 
+try:
+    from .json_utils import json_dumps
+except ImportError:  # imported as a top-level module, with scripts/lib on sys.path
+    from json_utils import json_dumps
 
-@dataclass
-class TestSummary:
-    """Summary statistics for test results."""
-    total: int
-    passed: int
-    failed: int
-    errors: int
-    skipped: int
-    duration: float
-    success_rate: float
-    categories: Dict[str, Dict[str, int]]
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; JUnit XML falls back to string assembly
+    etree = None
 
 
-class ReportGenerator:
-    """Generate test reports in various formats."""
-    
-    def __init__(self, project_root: Path, report_dir: Optional[Path] = None):
-        """
-        Initialize report generator.
-        
-        Args:
-            project_root: Root directory of the project
-            report_dir: Directory to save reports (defaults to project_root/test-reports)
-        """
-        self.project_root = project_root
-        self.report_dir = report_dir or project_root / 'test-reports'
-        self.report_dir.mkdir(parents=True, exist_ok=True)
-        
-    def generate_summary(self, results: List[Any]) -> TestSummary:
-        """
-        Generate summary statistics from test results.
-        
-        Args:
-            results: List of test results (TestResult objects or dicts)
-        
-        Returns:
-            TestSummary object
-        """
-        total = len(results)
-        passed = sum(1 for r in results if self._get_field(r, 'passed'))
-        failed = sum(1 for r in results if not self._get_field(r, 'passed') and not self._get_field(r, 'error'))
-        errors = sum(1 for r in results if self._get_field(r, 'error'))
-        skipped = sum(1 for r in results if self._get_field(r, 'skipped', False))
-        duration = sum(self._get_field(r, 'duration', 0) for r in results)
-        
-        # Calculate success rate
-        success_rate = (passed / total * 100) if total > 0 else 0
-        
-        # Group by categories
-        categories = {}
-        for result in results:
-            category = self._get_field(result, 'category', 'unknown')
-            if category not in categories:
-                categories[category] = {'total': 0, 'passed': 0, 'failed': 0}
-            
-            categories[category]['total'] += 1
-            if self._get_field(result, 'passed'):
-                categories[category]['passed'] += 1
-            else:
-                categories[category]['failed'] += 1
-        
-        return TestSummary(
-            total=total,
-            passed=passed,
-            failed=failed,
-            errors=errors,
-            skipped=skipped,
-            duration=duration,
-            success_rate=success_rate,
-            categories=categories
-        )
-    
-    def _get_field(self, obj: Any, field: str, default: Any = None) -> Any:
-        """Helper to get field from object or dict."""
-        if hasattr(obj, field):
-            return getattr(obj, field)
-        elif isinstance(obj, dict):
-            return obj.get(field, default)
-        return default
-    
-    def generate_json_report(self, 
-                           results: List[Any],
-                           metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Generate JSON report.
-        
-        Args:
-            results: List of test results
-            metadata: Optional metadata to include
-        
-        Returns:
-            Dictionary containing the full report
-        """
-        summary = self.generate_summary(results)
-        
-        # Convert results to dictionaries
-        results_data = []
-        for r in results:
-            if hasattr(r, '__dict__'):
-                data = {k: v for k, v in r.__dict__.items() if not k.startswith('_')}
-                # Convert datetime objects to strings
-                for k, v in data.items():
-                    if isinstance(v, datetime):
-                        data[k] = v.isoformat()
-                results_data.append(data)
-            else:
-                results_data.append(r)
-        
-        report = {
-            'timestamp': datetime.now().isoformat(),
-            'platform': {
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'machine': platform.machine(),
-                'processor': platform.processor(),
-                'python_version': platform.python_version()
-            },
-            'summary': asdict(summary),
-            'metadata': metadata or {},
-            'results': results_data
-        }
-        
-        return report
+def _json_default(obj: Any) -> str:
+    """Encode values the JSON serializer does not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+# Same replacements as html.escape(s, quote=True), applied in one pass.
+# The output is also valid in XML text and attribute values.
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+def _escape(s: str) -> str:
+    """Escape HTML/XML special characters, including both quote types."""
+    return s.translate(_HTML_ESCAPE_TABLE)
+
+
+# Control characters that XML 1.0 does not allow, even escaped
+_XML_INVALID_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _xml_text(value: Any) -> str:
+    """Convert a value to text that lxml will accept in XML content."""
+    return _XML_INVALID_CHARS.sub('', str(value))
+
+
+# Reports are written through one large buffer to keep write syscalls few
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=None)
+def _platform_info() -> Dict[str, str]:
+    """
+    Describe the host platform, querying it on first use only.
     
-    def save_json_report(self, 
-                        results: List[Any],
-                        filename: Optional[str] = None,
-                        metadata: Optional[Dict[str, Any]] = None) -> Path:
-        """
-        Save JSON report to file.
-        
-        Args:
-            results: List of test results
-            filename: Optional filename (defaults to timestamp-based name)
-            metadata: Optional metadata to include
-        
-        Returns:
-            Path to saved report
-        """
-        if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'report_{timestamp}.json'
-        
-        report_path = self.report_dir / filename
-        report = self.generate_json_report(results, metadata)
-        
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
-        
-        print(f"JSON report saved to {report_path}")
-        return report_path
+    Host details do not change during a run, and platform.processor() can be
+    slow (it may spawn a subprocess). Importing platform here also keeps it
+    out of module import for callers that never write a report header.
+    """
+    import platform
     
-    def generate_html_report(self,
-                           results: List[Any],
-                           metadata: Optional[Dict[str, Any]] = None) -> str:
-        """
-        Generate HTML report.
-        
-        Args:
-            results: List of test results
-            metadata: Optional metadata to include
-        
-        Returns:
-            HTML string
-        """
-        summary = self.generate_summary(results)
-        report_data = self.generate_json_report(results, metadata)
-        
-        # Generate HTML
-        html_content = f"""<!DOCTYPE html>
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'python_version': platform.python_version()
+    }
+
+
+# Static parts of the HTML report, built once at import time. Only the
+# *_TMPL strings contain str.format fields.
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>DSL-RS Test Report</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 10px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
+        }
         
-        header {{
+        header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .timestamp {{
+        .timestamp {
             opacity: 0.9;
             font-size: 0.9em;
-        }}
+        }
         
-        .summary {{
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 30px;
             background: #f8f9fa;
-        }}
+        }
         
-        .summary-card {{
+        .summary-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             text-align: center;
-        }}
+        }
         
-        .summary-card h3 {{
+        .summary-card h3 {
             color: #666;
             font-size: 0.9em;
             text-transform: uppercase;
             margin-bottom: 10px;
-        }}
+        }
         
-        .summary-card .value {{
+        .summary-card .value {
             font-size: 2em;
             font-weight: bold;
             color: #333;
-        }}
+        }
         
-        .summary-card.passed .value {{
+        .summary-card.passed .value {
             color: #28a745;
-        }}
+        }
         
-        .summary-card.failed .value {{
+        .summary-card.failed .value {
             color: #dc3545;
-        }}
+        }
         
-        .summary-card.errors .value {{
+        .summary-card.errors .value {
             color: #ff6b6b;
-        }}
+        }
         
-        .content {{
+        .content {
             padding: 30px;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 40px;
-        }}
+        }
         
-        h2 {{
+        h2 {
             color: #333;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 2px solid #667eea;
-        }}
+        }
         
-        .categories {{
+        .categories {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .category-card {{
+        .category-card {
             background: white;
             border: 1px solid #e0e0e0;
             border-radius: 8px;
             padding: 15px;
-        }}
+        }
         
-        .category-card h4 {{
+        .category-card h4 {
             margin-bottom: 10px;
             color: #666;
-        }}
+        }
         
-        .progress-bar {{
+        .progress-bar {
             height: 20px;
             background: #e0e0e0;
             border-radius: 10px;
             overflow: hidden;
             margin-bottom: 10px;
-        }}
+        }
         
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, #28a745 0%, #20c997 100%);
             transition: width 0.3s;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
-        }}
+        }
         
-        th {{
+        th {
             background: #667eea;
             color: white;
             padding: 12px;
             text-align: left;
             font-weight: 600;
-        }}
+        }
         
-        td {{
+        td {
             padding: 12px;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        tr:hover {{
+        tr:hover {
             background: #f8f9fa;
-        }}
+        }
         
-        .status {{
+        .status {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 20px;
             font-size: 0.85em;
             font-weight: 600;
-        }}
+        }
         
-        .status.passed {{
+        .status.passed {
             background: #d4edda;
             color: #155724;
-        }}
+        }
         
-        .status.failed {{
+        .status.failed {
             background: #f8d7da;
             color: #721c24;
-        }}
+        }
         
-        .status.error {{
+        .status.error {
             background: #fff3cd;
             color: #856404;
-        }}
+        }
         
-        .details {{
+        .details {
             max-width: 300px;
             overflow: hidden;
             text-overflow: ellipsis;
             white-space: nowrap;
-        }}
+        }
         
-        .details:hover {{
+        .details:hover {
             overflow: visible;
             white-space: normal;
             background: white;
@@ -381,71 +281,73 @@ class ReportGenerator:
             z-index: 10;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             padding: 5px;
-        }}
+        }
         
-        .platform-info {{
+        .platform-info {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 8px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .platform-info span {{
+        .platform-info span {
             display: inline-block;
             margin-right: 20px;
             color: #666;
-        }}
+        }
         
-        .platform-info strong {{
+        .platform-info strong {
             color: #333;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .summary {{
+        @media (max-width: 768px) {
+            .summary {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            h1 {{
+            h1 {
                 font-size: 1.8em;
-            }}
+            }
             
-            table {{
+            table {
                 font-size: 0.9em;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <header>
+"""
+
+_HTML_SUMMARY_TMPL = """        <header>
             <h1>DSL-RS Test Report</h1>
-            <p class="timestamp">Generated on {report_data['timestamp']}</p>
+            <p class="timestamp">Generated on {timestamp}</p>
         </header>
         
         <div class="summary">
             <div class="summary-card">
                 <h3>Total Tests</h3>
-                <div class="value">{summary.total}</div>
+                <div class="value">{total}</div>
             </div>
             <div class="summary-card passed">
                 <h3>Passed</h3>
-                <div class="value">{summary.passed}</div>
+                <div class="value">{passed}</div>
             </div>
             <div class="summary-card failed">
                 <h3>Failed</h3>
-                <div class="value">{summary.failed}</div>
+                <div class="value">{failed}</div>
             </div>
             <div class="summary-card errors">
                 <h3>Errors</h3>
-                <div class="value">{summary.errors}</div>
+                <div class="value">{errors}</div>
             </div>
             <div class="summary-card">
                 <h3>Success Rate</h3>
-                <div class="value">{summary.success_rate:.1f}%</div>
+                <div class="value">{success_rate:.1f}%</div>
             </div>
             <div class="summary-card">
                 <h3>Total Duration</h3>
-                <div class="value">{summary.duration:.2f}s</div>
+                <div class="value">{duration:.2f}s</div>
             </div>
         </div>
         
@@ -453,10 +355,10 @@ class ReportGenerator:
             <div class="section">
                 <h2>Platform Information</h2>
                 <div class="platform-info">
-                    <span><strong>System:</strong> {report_data['platform']['system']}</span>
-                    <span><strong>Python:</strong> {report_data['platform']['python_version']}</span>
-                    <span><strong>Machine:</strong> {report_data['platform']['machine']}</span>
-                    <span><strong>Processor:</strong> {report_data['platform']['processor']}</span>
+                    <span><strong>System:</strong> {system}</span>
+                    <span><strong>Python:</strong> {python_version}</span>
+                    <span><strong>Machine:</strong> {machine}</span>
+                    <span><strong>Processor:</strong> {processor}</span>
                 </div>
             </div>
             
@@ -464,21 +366,18 @@ class ReportGenerator:
                 <h2>Test Categories</h2>
                 <div class="categories">
 """
-        
-        # Add category cards
-        for category, stats in summary.categories.items():
-            success_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            html_content += f"""
+
+_HTML_CATEGORY_TMPL = """
                     <div class="category-card">
                         <h4>{category}</h4>
                         <div class="progress-bar">
                             <div class="progress-fill" style="width: {success_rate}%"></div>
                         </div>
-                        <p>{stats['passed']}/{stats['total']} passed ({success_rate:.1f}%)</p>
+                        <p>{passed}/{total} passed ({success_rate:.1f}%)</p>
                     </div>
 """
-        
-        html_content += """
+
+_HTML_TABLE_OPEN = """
                 </div>
             </div>
             
@@ -496,30 +395,8 @@ class ReportGenerator:
                     </thead>
                     <tbody>
 """
-        
-        # Add test results
-        for result in results:
-            name = html.escape(str(self._get_field(result, 'name', 'Unknown')))
-            category = html.escape(str(self._get_field(result, 'category', 'Unknown')))
-            passed = self._get_field(result, 'passed', False)
-            error = self._get_field(result, 'error')
-            duration = self._get_field(result, 'duration', 0)
-            
-            if error:
-                status = 'error'
-                status_text = 'ERROR'
-                details = html.escape(str(error))
-            elif passed:
-                status = 'passed'
-                status_text = 'PASSED'
-                details = 'Test completed successfully'
-            else:
-                status = 'failed'
-                status_text = 'FAILED'
-                stderr = self._get_field(result, 'stderr', '')
-                details = html.escape(stderr[:200] if stderr else 'Test failed')
-            
-            html_content += f"""
+
+_HTML_ROW_TMPL = """
                         <tr>
                             <td>{name}</td>
                             <td>{category}</td>
@@ -528,15 +405,19 @@ class ReportGenerator:
                             <td class="details" title="{details}">{details}</td>
                         </tr>
 """
-        
-        html_content += """
+
+_HTML_TABLE_CLOSE = """
                     </tbody>
                 </table>
             </div>
         </div>
     </div>
     
-    <script>
+"""
+
+# Client-side column sorting; only embedded for tables small enough to
+# re-sort in the browser without stalling it (see _HTML_SORT_MAX_ROWS).
+_HTML_SORT_SCRIPT = """    <script>
         // Add sorting functionality to the table
         document.addEventListener('DOMContentLoaded', function() {
             const table = document.getElementById('resultsTable');
@@ -573,16 +454,379 @@ class ReportGenerator:
             rows.forEach(row => tbody.appendChild(row));
         }
     </script>
-</body>
+"""
+
+_HTML_END = """</body>
 </html>
 """
+
+# Result rows rendered into one string per chunk, so large tables are
+# streamed in a few big writes rather than one small write per row
+_HTML_ROW_BATCH = 256
+
+# Largest results table that still gets the interactive sort script
+_HTML_SORT_MAX_ROWS = 1000
+
+# Row order in the HTML table: errors first, then failures, then passes
+_STATUS_ORDER = {'error': 0, 'failed': 1, 'passed': 2}
+
+
+@dataclass
+class TestSummary:
+    """Summary statistics for test results."""
+    total: int
+    passed: int
+    failed: int
+    errors: int
+    skipped: int
+    duration: float
+    success_rate: float
+    categories: Dict[str, Dict[str, int]]
+
+
+class ReportGenerator:
+    """Generate test reports in various formats."""
+    
+    def __init__(self, project_root: Path, report_dir: Optional[Path] = None):
+        """
+        Initialize report generator.
+        
+        Args:
+            project_root: Root directory of the project
+            report_dir: Directory to save reports (defaults to project_root/test-reports)
+        """
+        self.project_root = project_root
+        self.report_dir = report_dir or project_root / 'test-reports'
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        
+    def generate_summary(self, results: List[Any]) -> TestSummary:
+        """
+        Generate summary statistics from test results.
+        
+        Args:
+            results: List of test results (TestResult objects or dicts)
+        
+        Returns:
+            TestSummary object
+        """
+        total = len(results)
+        
+        passed, failed, errors, skipped, duration, categories = self._aggregate_results(results)
+        
+        # Calculate success rate
+        success_rate = (passed / total * 100) if total > 0 else 0
+        
+        return TestSummary(
+            total=total,
+            passed=passed,
+            failed=failed,
+            errors=errors,
+            skipped=skipped,
+            duration=duration,
+            success_rate=success_rate,
+            categories=categories
+        )
+    
+    def _aggregate_results(self, results: List[Any]) -> Tuple[int, int, int, int, float, Dict[str, Dict[str, int]]]:
+        """Aggregate summary counters for results of any supported type."""
+        passed = failed = errors = skipped = 0
+        duration = 0.0
+        # Per-category [total, passed, failed]; one hash lookup per result
+        category_counts = defaultdict(lambda: [0, 0, 0])
+        
+        # Single pass: read each field once per result
+        make_extractor = self._make_extractor
+        for result in results:
+            get = make_extractor(result)
+            result_passed = get('passed')
+            result_error = get('error')
+            
+            if result_passed:
+                passed += 1
+            if result_error:
+                errors += 1
+            elif not result_passed:
+                failed += 1
+            if get('skipped', False):
+                skipped += 1
+            duration += get('duration', 0)
+            
+            # Group by categories
+            counts = category_counts[get('category', 'unknown')]
+            counts[0] += 1
+            counts[1 if result_passed else 2] += 1
+        
+        categories = {
+            category: {'total': total, 'passed': ok, 'failed': bad}
+            for category, (total, ok, bad) in category_counts.items()
+        }
+        return passed, failed, errors, skipped, duration, categories
+    
+    def _get_field(self, obj: Any, field: str, default: Any = None) -> Any:
+        """Helper to get field from object or dict."""
+        return self._make_extractor(obj)(field, default)
+    
+    @staticmethod
+    def _make_extractor(obj: Any) -> Callable[..., Any]:
+        """
+        Build a field getter specialized for one result.
+        
+        The type check runs once per result instead of once per field, and
+        attribute access is a single getattr with a default rather than
+        hasattr followed by getattr.
+        """
+        if isinstance(obj, dict):
+            return obj.get
+        
+        def get(field: str, default: Any = None) -> Any:
+            return getattr(obj, field, default)
+        
+        return get
+    
+    def generate_json_report(self, 
+                           results: List[Any],
+                           metadata: Optional[Dict[str, Any]] = None,
+                           now: Optional[datetime] = None,
+                           summary: Optional[TestSummary] = None) -> Dict[str, Any]:
+        """
+        Generate JSON report.
+        
+        Args:
+            results: List of test results
+            metadata: Optional metadata to include
+            now: Report timestamp (defaults to the current time)
+            summary: Precomputed summary of ``results``, if already available
+        
+        Returns:
+            Dictionary containing the full report. Result fields keep their
+            original types, so datetimes must be encoded when serializing.
+        """
+        if summary is None:
+            summary = self.generate_summary(results)
+        return self._build_report_dict(results, metadata, summary, now)
+    
+    def _build_report_dict(self,
+                           results: List[Any],
+                           metadata: Optional[Dict[str, Any]],
+                           summary: TestSummary,
+                           now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Build the JSON report dictionary from a precomputed summary."""
+        report = self._report_header(summary, metadata, now)
+        report['results'] = self._serialize_results(results)
+        return report
+    
+    def _serialize_results(self, results: List[Any]) -> List[Any]:
+        """
+        Convert test results to dictionaries for the JSON report.
+        
+        Only JSON output needs this; the HTML and JUnit reports read result
+        fields directly and never materialize the converted list.
+        """
+        return list(map(self._result_to_dict, results))
+    
+    def _report_header(self,
+                       summary: TestSummary,
+                       metadata: Optional[Dict[str, Any]] = None,
+                       now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Build every top-level report section except the per-test results."""
+        return {
+            'timestamp': (now or datetime.now()).isoformat(),
+            'platform': dict(_platform_info()),
+            'summary': vars(summary).copy(),  # shallow: categories is shared, not deep-copied
+            'metadata': metadata or {},
+        }
+    
+    @staticmethod
+    def _result_to_dict(r: Any) -> Any:
+        """
+        Convert one test result to a dictionary of its public fields.
+        
+        Values are not converted; datetimes and other non-JSON types are
+        encoded by the serializer's default hook when the report is written.
+        """
+        if hasattr(r, '__dict__'):
+            d = {k: v for k, v in r.__dict__.items() if not k.startswith('_')}
+        else:
+            slots = getattr(type(r), '__slots__', None)
+            if slots is None:
+                return r
+            # e.g. TestResult, a slotted dataclass on Python 3.10+
+            d = {k: getattr(r, k) for k in slots if not k.startswith('_')}
+        
+        # TestResult stores its completion time as a shared stamp plus offset
+        offset_ns = d.pop('offset_ns', None)
+        if offset_ns and d.get('timestamp') is not None:
+            d['timestamp'] = d['timestamp'] + timedelta(microseconds=offset_ns // 1000)
+        return d
+    
+    def save_json_report(self, 
+                        results: List[Any],
+                        filename: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None,
+                        summary: Optional[TestSummary] = None) -> Path:
+        """
+        Save JSON report to file.
+        
+        Args:
+            results: List of test results
+            filename: Optional filename (defaults to timestamp-based name)
+            metadata: Optional metadata to include
+            summary: Precomputed summary of ``results``, if already available
+        
+        Returns:
+            Path to saved report
+        """
+        now = datetime.now()
+        if not filename:
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
+            filename = f'report_{timestamp}.json'
+        
+        report_path = self.report_dir / filename
+        
+        return self._write_chunks(report_path, 'JSON report',
+                                  self._iter_json_chunks(results, metadata, summary, now))
+    
+    def _iter_json_chunks(self,
+                          results: List[Any],
+                          metadata: Optional[Dict[str, Any]] = None,
+                          summary: Optional[TestSummary] = None,
+                          now: Optional[datetime] = None) -> Iterator[bytes]:
+        """
+        Yield the JSON report as UTF-8 bytes without building the results list.
+        
+        Top-level sections are written compactly, one per line, and each
+        result is serialized and emitted on its own line.
+        """
+        if summary is None:
+            summary = self.generate_summary(results)
+        header = self._report_header(summary, metadata, now)
+        
+        yield b'{\n'
+        for key, value in header.items():
+            yield b'  ' + json_dumps(key, _json_default) + b': ' + json_dumps(value, _json_default) + b',\n'
+        yield b'  "results": ['
+        for i, r in enumerate(results):
+            yield b',\n    ' if i else b'\n    '
+            yield json_dumps(self._result_to_dict(r), _json_default)
+        yield b'\n  ]\n}\n' if results else b']\n}\n'
+    
+    def _prepare_rows(self, results: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Extract and HTML-escape the per-result fields shared by HTML and JUnit.
+        
+        ``details`` is the short text for the HTML table; ``message`` is the
+        full escaped error or stderr for JUnit error/failure elements.
+        """
+        escape = _escape
+        make_extractor = self._make_extractor
+        rows = []
+        for result in results:
+            get = make_extractor(result)
+            error = get('error')
+            message = None
+            
+            if error:
+                status = 'error'
+                status_text = 'ERROR'
+                message = details = escape(str(error))
+            elif get('passed', False):
+                status = 'passed'
+                status_text = 'PASSED'
+                details = 'Test completed successfully'
+            else:
+                status = 'failed'
+                status_text = 'FAILED'
+                stderr = get('stderr', '')
+                details = escape(stderr[:200] if stderr else 'Test failed')
+                message = escape(str(get('stderr', 'Test failed')))
+            
+            rows.append({
+                'name': escape(str(get('name', 'Unknown'))),
+                'category': escape(str(get('category', 'Unknown'))),
+                'status': status,
+                'status_text': status_text,
+                'duration': get('duration', 0),
+                'details': details,
+                'message': message,
+            })
+        return rows
+    
+    def generate_html_report(self,
+                           results: List[Any],
+                           metadata: Optional[Dict[str, Any]] = None,
+                           now: Optional[datetime] = None) -> str:
+        """
+        Generate HTML report.
+        
+        Args:
+            results: List of test results
+            metadata: Optional metadata to include
+            now: Report timestamp (defaults to the current time)
+        
+        Returns:
+            HTML string
+        """
+        return ''.join(self._iter_html_chunks(results, metadata, now=now))
+    
+    def _iter_html_chunks(self,
+                          results: List[Any],
+                          metadata: Optional[Dict[str, Any]] = None,
+                          summary: Optional[TestSummary] = None,
+                          rows: Optional[List[Dict[str, Any]]] = None,
+                          now: Optional[datetime] = None) -> Iterator[str]:
+        """
+        Yield the HTML report in document order, one fragment at a time.
+        
+        ``summary`` and ``rows`` may be passed in when they have already been
+        computed for another report format.
+        """
+        if summary is None:
+            summary = self.generate_summary(results)
+        if rows is None:
+            rows = self._prepare_rows(results)
+        
+        platform_info = _platform_info()
+        
+        # Generate HTML
+        yield _HTML_HEAD
+        yield _HTML_SUMMARY_TMPL.format(
+            timestamp=(now or datetime.now()).isoformat(),
+            total=summary.total,
+            passed=summary.passed,
+            failed=summary.failed,
+            errors=summary.errors,
+            success_rate=summary.success_rate,
+            duration=summary.duration,
+            system=platform_info['system'],
+            python_version=platform_info['python_version'],
+            machine=platform_info['machine'],
+            processor=platform_info['processor'],
+        )
+        
+        # Add category cards
+        for category, stats in summary.categories.items():
+            success_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            yield _HTML_CATEGORY_TMPL.format(category=category, success_rate=success_rate,
+                                             passed=stats['passed'], total=stats['total'])
+        
+        yield _HTML_TABLE_OPEN
         
-        return html_content
+        # Add test results, presorted so problems and slow tests come first
+        rows = sorted(rows, key=lambda row: (_STATUS_ORDER[row['status']], -row['duration']))
+        render_row = _HTML_ROW_TMPL.format_map
+        for start in range(0, len(rows), _HTML_ROW_BATCH):
+            yield ''.join(map(render_row, rows[start:start + _HTML_ROW_BATCH]))
+        
+        yield _HTML_TABLE_CLOSE
+        if len(rows) <= _HTML_SORT_MAX_ROWS:
+            yield _HTML_SORT_SCRIPT
+        yield _HTML_END
     
     def save_html_report(self,
                         results: List[Any],
                         filename: Optional[str] = None,
-                        metadata: Optional[Dict[str, Any]] = None) -> Path:
+                        metadata: Optional[Dict[str, Any]] = None,
+                        summary: Optional[TestSummary] = None) -> Path:
         """
         Save HTML report to file.
         
@@ -590,89 +834,180 @@ class ReportGenerator:
             results: List of test results
             filename: Optional filename (defaults to timestamp-based name)
             metadata: Optional metadata to include
+            summary: Precomputed summary of ``results``, if already available
         
         Returns:
             Path to saved report
         """
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             filename = f'report_{timestamp}.html'
         
         report_path = self.report_dir / filename
-        html_content = self.generate_html_report(results, metadata)
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
         
-        print(f"HTML report saved to {report_path}")
-        return report_path
+        return self._write_chunks(report_path, 'HTML report',
+                                  self._iter_html_chunks(results, metadata, summary, now=now))
     
-    def generate_junit_xml(self, results: List[Any]) -> str:
+    def generate_junit_xml(self, results: List[Any], now: Optional[datetime] = None) -> str:
         """
         Generate JUnit XML report for CI/CD integration.
         
         Args:
             results: List of test results
+            now: Report timestamp (defaults to the current time)
         
         Returns:
             XML string
         """
-        summary = self.generate_summary(results)
-        timestamp = datetime.now().isoformat()
+        return ''.join(self._iter_junit_chunks(results, self.generate_summary(results), now=now))
+    
+    def _iter_junit_chunks(self,
+                           results: List[Any],
+                           summary: TestSummary,
+                           rows: Optional[List[Dict[str, Any]]] = None,
+                           now: Optional[datetime] = None) -> Iterator[str]:
+        """
+        Yield the JUnit XML document for a precomputed summary.
+        
+        With lxml installed the document is built and serialized by libxml2
+        in one piece; otherwise it is assembled from the escaped ``rows``.
+        """
+        timestamp = (now or datetime.now()).isoformat()
         
-        xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+        if etree is not None:
+            yield self._junit_xml_lxml(results, summary, timestamp)
+            return
+        
+        if rows is None:
+            rows = self._prepare_rows(results)
+        
+        yield f"""<?xml version="1.0" encoding="UTF-8"?>
 <testsuites name="DSL-RS Tests" tests="{summary.total}" failures="{summary.failed}" errors="{summary.errors}" time="{summary.duration:.3f}">
     <testsuite name="DSL-RS" tests="{summary.total}" failures="{summary.failed}" errors="{summary.errors}" time="{summary.duration:.3f}" timestamp="{timestamp}">
 """
         
-        for result in results:
-            name = html.escape(str(self._get_field(result, 'name', 'Unknown')))
-            category = html.escape(str(self._get_field(result, 'category', 'Unknown')))
-            duration = self._get_field(result, 'duration', 0)
-            passed = self._get_field(result, 'passed', False)
-            error = self._get_field(result, 'error')
+        for row in rows:
+            yield f'        <testcase classname="{row["category"]}" name="{row["name"]}" time="{row["duration"]:.3f}">\n'
             
-            xml_content += f'        <testcase classname="{category}" name="{name}" time="{duration:.3f}">\n'
+            if row['status'] == 'error':
+                yield f'            <error message="{row["message"]}"/>\n'
+            elif row['status'] == 'failed':
+                yield f'            <failure message="Test failed">{row["message"]}</failure>\n'
             
-            if error:
-                error_msg = html.escape(str(error))
-                xml_content += f'            <error message="{error_msg}"/>\n'
-            elif not passed:
-                stderr = html.escape(str(self._get_field(result, 'stderr', 'Test failed')))
-                xml_content += f'            <failure message="Test failed">{stderr}</failure>\n'
-            
-            xml_content += '        </testcase>\n'
+            yield '        </testcase>\n'
         
-        xml_content += """    </testsuite>
+        yield """    </testsuite>
 </testsuites>
 """
+    
+    def _junit_xml_lxml(self, results: List[Any], summary: TestSummary, timestamp: str) -> str:
+        """Build the JUnit XML document with lxml.etree."""
+        totals = {
+            'tests': str(summary.total),
+            'failures': str(summary.failed),
+            'errors': str(summary.errors),
+            'time': f'{summary.duration:.3f}',
+        }
+        root = etree.Element('testsuites', name='DSL-RS Tests', **totals)
+        suite = etree.SubElement(root, 'testsuite', name='DSL-RS', **totals, timestamp=timestamp)
+        
+        make_extractor = self._make_extractor
+        for result in results:
+            get = make_extractor(result)
+            testcase = etree.SubElement(suite, 'testcase',
+                                        classname=_xml_text(get('category', 'Unknown')),
+                                        name=_xml_text(get('name', 'Unknown')),
+                                        time=f"{get('duration', 0):.3f}")
+            error = get('error')
+            if error:
+                etree.SubElement(testcase, 'error', message=_xml_text(error))
+            elif not get('passed', False):
+                failure = etree.SubElement(testcase, 'failure', message='Test failed')
+                failure.text = _xml_text(get('stderr', 'Test failed'))
         
-        return xml_content
+        return etree.tostring(root, pretty_print=True, xml_declaration=True,
+                              encoding='UTF-8').decode('utf-8')
     
     def save_junit_xml(self,
                       results: List[Any],
-                      filename: Optional[str] = None) -> Path:
+                      filename: Optional[str] = None,
+                      summary: Optional[TestSummary] = None) -> Path:
         """
         Save JUnit XML report.
         
         Args:
             results: List of test results
             filename: Optional filename
+            summary: Precomputed summary of ``results``, if already available
         
         Returns:
             Path to saved report
         """
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             filename = f'junit_{timestamp}.xml'
         
+        if summary is None:
+            summary = self.generate_summary(results)
+        
         report_path = self.report_dir / filename
-        xml_content = self.generate_junit_xml(results)
+        return self._write_chunks(report_path, 'JUnit XML report',
+                                  self._iter_junit_chunks(results, summary, now=now))
+    
+    def save_all_reports(self,
+                         results: List[Any],
+                         metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Path]:
+        """
+        Save JSON, HTML and JUnit XML reports concurrently.
+        
+        The summary and escaped rows are computed once and shared by all
+        formats; each report is then rendered and written on its own thread.
+        
+        Args:
+            results: List of test results
+            metadata: Optional metadata to include
+        
+        Returns:
+            Mapping of format name ('json', 'html', 'junit') to saved path
+        """
+        summary = self.generate_summary(results)
+        rows = self._prepare_rows(results)
+        # One timestamp for the whole batch so the files can be correlated
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        
+        jobs = {
+            'json': (f'report_{timestamp}.json', 'JSON report',
+                     self._iter_json_chunks(results, metadata, summary, now)),
+            'html': (f'report_{timestamp}.html', 'HTML report',
+                     self._iter_html_chunks(results, metadata, summary, rows, now)),
+            'junit': (f'junit_{timestamp}.xml', 'JUnit XML report',
+                      self._iter_junit_chunks(results, summary, rows, now)),
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                fmt: executor.submit(self._write_chunks, self.report_dir / filename, label, chunks)
+                for fmt, (filename, label, chunks) in jobs.items()
+            }
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
+    @staticmethod
+    def _write_chunks(report_path: Path, label: str, chunks: Iterator[Any]) -> Path:
+        """
+        Write str or bytes chunks to a report file, rendering them lazily.
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
+        The file is opened in binary mode with a large buffer, so text chunks
+        are encoded to UTF-8 once and bypass the text I/O layer.
+        """
+        with open(report_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            for chunk in chunks:
+                write(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'))
         
-        print(f"JUnit XML report saved to {report_path}")
+        print(f"{label} saved to {report_path}")
         return report_path
 
 
@@ -717,9 +1052,7 @@ if __name__ == '__main__':
     generator = ReportGenerator(Path.cwd())
     
     # Generate and save all report formats
-    generator.save_json_report(sample_results)
-    generator.save_html_report(sample_results)
-    generator.save_junit_xml(sample_results)
+    generator.save_all_reports(sample_results)
     
     # Print summary
     summary = generator.generate_summary(sample_results)
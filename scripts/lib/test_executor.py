@@ -4,21 +4,31 @@ Handles parallel execution, timeouts, and output capture.
 """
 
 import subprocess
+import sys
 import time
 import threading
 import queue
 import os
+import re
 import signal
-import platform
+import selectors
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError, as_completed
+from typing import Dict, List, Any, Tuple, Optional, Iterable, Set, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
-import multiprocessing
 
+try:
+    from .json_utils import json_loads
+except ImportError:  # imported as a top-level module, with scripts/lib on sys.path
+    from json_utils import json_loads
 
-@dataclass
+
+# slots=True needs Python 3.10; older interpreters keep a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TestResult:
     """Container for test execution results."""
     name: str
@@ -30,7 +40,349 @@ class TestResult:
     passed: bool
     config: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    cpu_time: float = 0.0  # user + system seconds of the process tree, where measured
+    # Completion time, stored as a start stamp shared by many results plus
+    # this result's offset from it; ReportGenerator combines the two
+    timestamp: Optional[datetime] = None
+    offset_ns: int = 0
+
+
+_IS_WINDOWS = os.name == 'nt'
+
+# Start every test in its own process group so a timeout can stop the whole
+# tree (cargo, rustc, test binaries) rather than only the direct child.
+if _IS_WINDOWS:
+    _NEW_PROCESS_GROUP = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    _TERMINATE_SIGNAL = signal.CTRL_BREAK_EVENT
+else:
+    _NEW_PROCESS_GROUP = {'start_new_session': True}
+    _TERMINATE_SIGNAL = signal.SIGTERM
+
+
+def _signal_group(process: subprocess.Popen, sig: int):
+    """Send a signal to a test's process group, ignoring exited groups."""
+    try:
+        if _IS_WINDOWS:
+            process.send_signal(sig)
+        else:
+            os.killpg(process.pid, sig)
+    except OSError:  # group already gone
+        pass
+
+
+def _load_duration_history(report_dir: Path) -> Dict[str, float]:
+    """
+    Read test durations by name from the newest JSON report, if any.
+    
+    Runs reported per test case are also given the total of their cases'
+    durations under their category, the name of the run.
+    """
+    try:
+        latest = max(report_dir.glob('report_*.json'), key=lambda p: p.stat().st_mtime, default=None)
+        if latest is None:
+            return {}
+        with open(latest, 'rb') as f:
+            report = json_loads(f.read())
+        history: Dict[str, float] = {}
+        totals: Dict[str, float] = {}
+        for r in report.get('results', []):
+            if isinstance(r, dict) and 'name' in r and 'duration' in r:
+                history[r['name']] = float(r['duration'])
+                if 'category' in r:
+                    totals[r['category']] = totals.get(r['category'], 0.0) + float(r['duration'])
+        for category, total in totals.items():
+            history.setdefault(category, total)
+        return history
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Missing, unreadable or foreign report: fall back to timeouts
+        return {}
+
+
+def _available_cpus() -> Set[int]:
+    """Return the CPUs this process may run on, or an empty set if unknown."""
+    if not hasattr(os, 'sched_getaffinity'):
+        return set()
+    return os.sched_getaffinity(0)
+
+
+def _set_affinity(pid: int, cpus: Iterable[int]):
+    """
+    Pin a process to the given CPUs where supported (Linux).
+    
+    CPUs this process may not use are dropped; if none remain the process
+    is left unpinned.
+    """
+    cpus = set(cpus) & _available_cpus()
+    if not cpus:
+        return
+    try:
+        os.sched_setaffinity(pid, cpus)
+    except OSError:  # exited already, or affinity blocked by a sandbox
+        pass
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Open a pidfd for a child process, or return None if unsupported."""
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        # Kernel older than 5.3 or pidfds blocked by a sandbox
+        return None
+
+
+# Bytes of output kept from each end of a test's stdout and stderr
+_OUTPUT_CAPTURE_LIMIT = 4 * 1024 * 1024
+
+
+class _BoundedOutput:
+    """
+    Capture the first and last ``limit`` bytes of a stream.
+    
+    Output between the two is counted but dropped, so a very chatty test
+    (e.g. ``cargo test -- --nocapture``) holds at most ``2 * limit`` bytes.
+    """
+    __slots__ = ('limit', 'head', 'tail', 'elided')
+    
+    def __init__(self, limit: int = _OUTPUT_CAPTURE_LIMIT):
+        self.limit = limit
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.elided = 0
+    
+    def feed(self, chunk: bytes):
+        """Append a chunk of output."""
+        room = self.limit - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self.tail += chunk
+            excess = len(self.tail) - self.limit
+            if excess > 0:
+                # Deleting from the front of a bytearray is amortized O(1)
+                del self.tail[:excess]
+                self.elided += excess
+    
+    def getvalue(self) -> bytes:
+        """Return the captured output, marking where bytes were dropped."""
+        if not self.elided:
+            return bytes(self.head + self.tail)
+        marker = b'\n...[%d bytes elided]...\n' % self.elided
+        return bytes(self.head) + marker + bytes(self.tail)
+
+
+def _read_available(fd: int, buffer: _BoundedOutput) -> bool:
+    """
+    Read everything currently buffered in a non-blocking pipe.
+    
+    Returns:
+        False once the pipe has reached end of file, True otherwise
+    """
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return True
+        if not chunk:
+            return False
+        buffer.feed(chunk)
+
+
+def _drain_until_exit(selector: selectors.BaseSelector, deadline: Optional[float]) -> bool:
+    """
+    Drain pipe output until the child's pidfd signals exit.
+    
+    The selector holds the pidfd (with no data) and each output pipe (with
+    its _BoundedOutput as data). Once the child has exited, the pipes are read
+    one final time without waiting for EOF, so grandchildren that inherited
+    them cannot hold up the caller.
+    
+    Returns:
+        True if the child exited, False if the deadline passed first
+    """
+    while True:
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+        
+        exited = False
+        for key, _ in selector.select(remaining):
+            if key.data is None:
+                exited = True
+            elif not _read_available(key.fd, key.data):
+                selector.unregister(key.fd)
+        
+        if exited:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    _read_available(key.fd, key.data)
+            return True
+
+
+def _terminate_groups(processes: List[subprocess.Popen], grace: float):
+    """
+    Ask process groups to terminate, then kill those still running.
+    
+    All groups share one ``grace`` period, so stopping many tests takes no
+    longer than stopping one.
+    """
+    for process in processes:
+        _signal_group(process, _TERMINATE_SIGNAL)
+    
+    deadline = time.monotonic() + grace
+    delay = 0.0005
+    while any(p.poll() is None for p in processes) and time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+    
+    for process in processes:
+        if _IS_WINDOWS:
+            if process.poll() is None:
+                process.kill()
+        else:
+            # Also reaps grandchildren that outlived the group leader
+            _signal_group(process, signal.SIGKILL)
+
+
+def _reap(process: subprocess.Popen) -> float:
+    """
+    Reap an exited child and return its CPU time.
+    
+    Uses wait4() so the child's resource usage, which includes the
+    descendants it waited for (cargo's rustc and test binaries), is not
+    discarded as it would be by Popen.wait().
+    
+    Returns:
+        User plus system CPU seconds, or 0.0 if the child was already reaped
+    """
+    if process.returncode is None:
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+        except ChildProcessError:
+            pass
+        else:
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return rusage.ru_utime + rusage.ru_stime
+    process.wait()
+    return 0.0
+
+
+# Progress lines written per batch, and how long to wait for a batch to fill
+_PROGRESS_BATCH = 32
+_PROGRESS_LINGER = 0.05
+# Longest a batch waits for its progress lines to be written
+_PROGRESS_FLUSH_TIMEOUT = 5.0
+
+
+def _format_progress(test_name: str, passed: bool, error: bool) -> str:
+    """Format one progress line."""
+    if error:
+        status = "ERROR"
+        symbol = "✗"
+    elif passed:
+        status = "PASS"
+        symbol = "✓"
+    else:
+        status = "FAIL"
+        symbol = "✗"
+    
+    return f"  [{symbol}] {test_name}: {status}"
+
+
+# libtest's human-readable result line, e.g. "test tests::parse ... ok";
+# doctest names contain spaces ("src/lib.rs - foo (line 12)")
+_TEST_LINE = re.compile(r'^test (.+?) \.\.\. (ok|FAILED|ignored)$', re.MULTILINE)
+
+# A failing test's captured output in libtest's "failures:" section, which
+# runs until the next test's block or the closing list of failed names
+_FAILURE_BLOCK = re.compile(r'^---- (.+?) stdout ----\n(.*?)(?=^---- |^failures:$|\Z)',
+                            re.MULTILINE | re.DOTALL)
+
+
+def _parse_test_cases(stdout: str) -> List[Tuple[str, bool, float, str]]:
+    """
+    Extract per-test outcomes from ``cargo test`` output in one pass.
+    
+    Reads libtest's JSON events (``--format json``) when present, otherwise
+    its human-readable ``test <name> ... ok|FAILED`` lines, taking a failing
+    test's output from the ``failures:`` section. Ignored tests are left out.
+    
+    Returns:
+        List of (name, passed, duration, output) tuples
+    """
+    cases = []
+    for line in stdout.splitlines():
+        if not line.startswith('{'):
+            continue
+        try:
+            event = json_loads(line)
+        except ValueError:
+            continue
+        if event.get('type') == 'test' and event.get('event') in ('ok', 'failed'):
+            cases.append((
+                event['name'],
+                event['event'] == 'ok',
+                float(event.get('exec_time', 0.0)),
+                event.get('stdout', '')
+            ))
+    
+    if not cases:
+        failures = {name: output.strip() for name, output in _FAILURE_BLOCK.findall(stdout)}
+        cases = [(name, outcome == 'ok', 0.0, failures.get(name, ''))
+                 for name, outcome in _TEST_LINE.findall(stdout)
+                 if outcome != 'ignored']
+    return cases
+
+
+def _all_passed(result: Union[TestResult, List[TestResult]]) -> bool:
+    """Whether a test, or every case of a per-test-case run, passed."""
+    if isinstance(result, list):
+        return all(r.passed for r in result)
+    return result.passed
+
+
+def _write_progress(lines: List[str]):
+    """
+    Write progress lines to stdout in one write where possible.
+    
+    Output problems never propagate: a line the console cannot encode
+    (e.g. the check mark on a cp1252 or ASCII stream) is written with
+    replacement characters, and lines hitting a closed pipe are dropped.
+    """
+    stream = sys.stdout
+    try:
+        stream.write('\n'.join(lines) + '\n')
+        stream.flush()
+        return
+    except (OSError, UnicodeEncodeError):
+        pass
+    
+    encoding = getattr(stream, 'encoding', None) or 'ascii'
+    for line in lines:
+        try:
+            try:
+                stream.write(line + '\n')
+            except UnicodeEncodeError:
+                stream.write(line.encode(encoding, 'replace').decode(encoding) + '\n')
+            stream.flush()
+        except (OSError, UnicodeEncodeError, LookupError):
+            pass
+
+
+def _bounded(data: bytes) -> bytes:
+    """Apply the capture limit to output that was read in full."""
+    buffer = _BoundedOutput()
+    buffer.feed(data)
+    return buffer.getvalue()
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output, translating newlines as text mode would."""
+    return data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
 
 
 class TestExecutor:
@@ -45,16 +397,34 @@ class TestExecutor:
             max_workers: Maximum number of parallel workers (defaults to CPU count)
         """
         self.project_root = project_root
-        self.max_workers = max_workers or multiprocessing.cpu_count()
-        self.results_queue = queue.Queue()
-        self.active_processes = {}
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Running processes by pid, shared by worker threads; the lock only
+        # guards insert/remove/snapshot, never I/O or signalling
+        self._active_lock = threading.Lock()
+        self._active_processes: Dict[int, subprocess.Popen] = {}
         self._shutdown = False
+        # Results are stamped with this wall-clock time plus a monotonic
+        # offset, so no datetime is created per result
+        self._epoch = datetime.now()
+        self._epoch_ns = time.perf_counter_ns()
+        # Snapshot of the environment every test process starts from
+        self._base_env = os.environ.copy()
+        # Worker threads shared by every parallel batch; created lazily
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Whether the toolchain's libtest accepts --format json; probed lazily
+        self._libtest_json: Optional[bool] = None
+        # Test durations by name from earlier runs; loaded lazily
+        self._duration_history: Optional[Dict[str, float]] = None
+        # Progress lines are written by a background thread, started lazily
+        self._progress_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._progress_thread: Optional[threading.Thread] = None
     
     def run_command(self, 
                    cmd: List[str], 
                    env: Optional[Dict[str, str]] = None,
                    timeout: Optional[int] = None,
-                   cwd: Optional[Path] = None) -> Tuple[int, str, str]:
+                   cwd: Optional[Path] = None,
+                   cpu_affinity: Optional[Iterable[int]] = None) -> Tuple[int, str, str]:
         """
         Execute a command with timeout and capture output.
         
@@ -63,15 +433,30 @@ class TestExecutor:
             env: Optional environment variables
             timeout: Optional timeout in seconds
             cwd: Optional working directory
+            cpu_affinity: Optional CPUs to pin the process to (Linux only)
         
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
-        env_vars = os.environ.copy()
-        if env:
-            env_vars.update({k: str(v) for k, v in env.items()})
+        exit_code, stdout, stderr, _ = self._run_process(cmd, env, timeout, cwd, cpu_affinity)
+        return exit_code, stdout, stderr
+    
+    def _run_process(self,
+                     cmd: List[str],
+                     env: Optional[Dict[str, str]],
+                     timeout: Optional[float],
+                     cwd: Optional[Path] = None,
+                     cpu_affinity: Optional[Iterable[int]] = None) -> Tuple[int, str, str, float]:
+        """
+        Execute a command as run_command() does, also measuring CPU time.
         
-        working_dir = cwd or self.project_root
+        Returns:
+            Tuple of (exit_code, stdout, stderr, cpu_time)
+        """
+        # Without overrides env stays None so the child inherits our environment
+        env_vars = None
+        if env:
+            env_vars = {**self._base_env, **{k: str(v) for k, v in env.items()}}
         
         try:
             process = subprocess.Popen(
@@ -79,44 +464,122 @@ class TestExecutor:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 env=env_vars,
-                cwd=working_dir,
-                universal_newlines=True
+                cwd=cwd or self.project_root,
+                **_NEW_PROCESS_GROUP
             )
             
+            if cpu_affinity:
+                # Processes it starts from now on (rustc, test binaries)
+                # inherit the mask
+                _set_affinity(process.pid, cpu_affinity)
+            
             # Store process for potential cleanup
-            self.active_processes[process.pid] = process
+            with self._active_lock:
+                self._active_processes[process.pid] = process
             
             try:
-                stdout, stderr = process.communicate(timeout=timeout)
-                exit_code = process.returncode
-            except subprocess.TimeoutExpired:
-                # Kill the process on timeout
-                if platform.system() == 'Windows':
-                    process.terminate()
-                else:
-                    process.send_signal(signal.SIGTERM)
-                    time.sleep(1)
-                    if process.poll() is None:
-                        process.kill()
-                
-                stdout, stderr = process.communicate()
-                exit_code = -1
-                stderr = f"TIMEOUT: Process killed after {timeout} seconds\n{stderr}"
+                stdout, stderr, timed_out, cpu_time = self._communicate(process, timeout)
+            except BaseException:
+                # Interrupted (e.g. Ctrl-C): the group no longer shares our
+                # terminal's process group, so stop it explicitly
+                self._terminate(process, grace=0)
+                raise
             finally:
                 # Remove from active processes
-                self.active_processes.pop(process.pid, None)
+                with self._active_lock:
+                    self._active_processes.pop(process.pid, None)
+            
+            stdout = _decode_output(stdout)
+            stderr = _decode_output(stderr)
             
-            return exit_code, stdout, stderr
+            if timed_out:
+                exit_code = -1
+                stderr = f"TIMEOUT: Process killed after {timeout} seconds\n{stderr}"
+            else:
+                exit_code = process.returncode
+            
+            return exit_code, stdout, stderr, cpu_time
             
         except Exception as e:
-            return -1, "", f"Failed to execute command: {e}"
+            return -1, "", f"Failed to execute command: {e}", 0.0
+    
+    def _communicate(self,
+                     process: subprocess.Popen,
+                     timeout: Optional[float]) -> Tuple[bytes, bytes, bool, float]:
+        """
+        Wait for a process while draining its output pipes.
+        
+        Only the first and last _OUTPUT_CAPTURE_LIMIT bytes of each stream
+        are kept; the pipes are drained continuously so the child never
+        blocks on a full pipe.
+        
+        On Linux the wait is a single selector over a pidfd and both pipes,
+        so no helper threads are started; elsewhere it falls back to
+        Popen.communicate(). A process still running at the timeout is
+        terminated and its remaining output collected.
+        
+        CPU time is only measured on the selector path; the fallback and
+        timed-out processes report 0.0.
+        
+        Args:
+            process: Process started with stdout and stderr pipes
+            timeout: Optional timeout in seconds
+        
+        Returns:
+            Tuple of (stdout, stderr, timed_out, cpu_time)
+        """
+        pidfd = _open_pidfd(process.pid)
+        
+        if pidfd is None:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+                timed_out = False
+            except subprocess.TimeoutExpired:
+                self._terminate(process)
+                stdout, stderr = process.communicate()
+                timed_out = True
+            return _bounded(stdout), _bounded(stderr), timed_out, 0.0
+        
+        stdout, stderr = _BoundedOutput(), _BoundedOutput()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(pidfd, selectors.EVENT_READ)
+                for pipe, buffer in ((process.stdout, stdout), (process.stderr, stderr)):
+                    os.set_blocking(pipe.fileno(), False)
+                    selector.register(pipe.fileno(), selectors.EVENT_READ, buffer)
+                
+                timed_out = not _drain_until_exit(selector, deadline)
+                if timed_out:
+                    self._terminate(process)
+                    _drain_until_exit(selector, None)
+        finally:
+            os.close(pidfd)
+        
+        process.stdout.close()
+        process.stderr.close()
+        cpu_time = _reap(process)
+        return stdout.getvalue(), stderr.getvalue(), timed_out, cpu_time
+    
+    def _terminate(self, process: subprocess.Popen, grace: float = 1.0):
+        """
+        Stop a process and everything it spawned.
+        
+        Each test runs in its own process group, so cargo's rustc and test
+        binary children are signalled along with it. The group is asked to
+        terminate first and killed if the process is still running after
+        ``grace`` seconds, polling with exponential backoff in between.
+        """
+        _terminate_groups([process], grace)
     
     def run_cargo_test(self,
                       test_name: str,
                       test_filter: Optional[str] = None,
                       features: Optional[List[str]] = None,
                       env: Optional[Dict[str, str]] = None,
-                      timeout: Optional[int] = 300) -> TestResult:
+                      timeout: Optional[int] = 300,
+                      cpu_affinity: Optional[Iterable[int]] = None) -> TestResult:
         """
         Run a cargo test with specified parameters.
         
@@ -126,11 +589,12 @@ class TestExecutor:
             features: Optional list of cargo features to enable
             env: Optional environment variables
             timeout: Timeout in seconds
+            cpu_affinity: Optional CPUs to pin cargo and the tests to
         
         Returns:
             TestResult object
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Build cargo command
         cmd = ['cargo', 'test']
@@ -144,9 +608,10 @@ class TestExecutor:
         cmd.extend(['--', '--nocapture'])
         
         # Execute command
-        exit_code, stdout, stderr = self.run_command(cmd, env=env, timeout=timeout)
+        exit_code, stdout, stderr, cpu_time = self._run_process(cmd, env, timeout, cpu_affinity=cpu_affinity)
         
-        duration = time.time() - start_time
+        end_ns = time.perf_counter_ns()
+        duration = (end_ns - start_ns) / 1e9
         
         return TestResult(
             name=test_name,
@@ -156,9 +621,113 @@ class TestExecutor:
             stderr=stderr,
             duration=duration,
             passed=(exit_code == 0),
+            cpu_time=cpu_time,
+            timestamp=self._epoch,
+            offset_ns=end_ns - self._epoch_ns,
             config={'filter': test_filter, 'features': features, 'env': env}
         )
     
+    def run_cargo_test_cases(self,
+                            test_name: str,
+                            test_filter: Optional[str] = None,
+                            features: Optional[List[str]] = None,
+                            env: Optional[Dict[str, str]] = None,
+                            timeout: Optional[int] = 300,
+                            cpu_affinity: Optional[Iterable[int]] = None) -> List[TestResult]:
+        """
+        Run a cargo test and report each test case separately.
+        
+        All test targets are run (``--no-fail-fast``), and every passing or
+        failing test becomes its own TestResult in category ``test_name``,
+        timed from libtest's JSON output. The run's own duration is kept as
+        the duration history entry for ``test_name``. If the run fails
+        without any failing test (e.g. a build error or timeout), a result
+        for the whole run is included as well.
+        
+        Per-test output needs the JSON format, which stable toolchains
+        only allow with ``RUSTC_BOOTSTRAP=1``; without it this falls back
+        to a single ``run_cargo_test`` result for the whole run, so its
+        output, duration and CPU time are not lost.
+        
+        Args:
+            test_name: Name for this test run
+            test_filter: Optional filter for test names
+            features: Optional list of cargo features to enable
+            env: Optional environment variables
+            timeout: Timeout in seconds
+            cpu_affinity: Optional CPUs to pin cargo and the tests to
+        
+        Returns:
+            List of TestResult objects
+        """
+        if not self._libtest_json_supported():
+            return [self.run_cargo_test(test_name, test_filter, features, env, timeout, cpu_affinity)]
+        
+        start_ns = time.perf_counter_ns()
+        
+        cmd = ['cargo', 'test', '--no-fail-fast']
+        
+        if features:
+            cmd.extend(['--features', ','.join(features)])
+        
+        if test_filter:
+            cmd.append(test_filter)
+        
+        cmd.extend(['--', '-Z', 'unstable-options', '--format', 'json', '--report-time'])
+        
+        exit_code, stdout, stderr, cpu_time = self._run_process(cmd, env, timeout, cpu_affinity=cpu_affinity)
+        
+        end_ns = time.perf_counter_ns()
+        duration = (end_ns - start_ns) / 1e9
+        config = {'filter': test_filter, 'features': features, 'env': env}
+        # Order later batches by the whole run (build included), not the
+        # sum of the tests' own times
+        self._get_duration_history()[test_name] = duration
+        
+        results = [
+            TestResult(
+                name=name,
+                category=test_name,
+                exit_code=0 if passed else 101,
+                stdout=output,
+                stderr='',
+                duration=case_duration,
+                passed=passed,
+                timestamp=self._epoch,
+                offset_ns=end_ns - self._epoch_ns,
+                config=config
+            )
+            for name, passed, case_duration, output in _parse_test_cases(stdout)
+        ]
+        
+        if exit_code != 0 and all(result.passed for result in results):
+            results.append(TestResult(
+                name=test_name,
+                category='cargo_test',
+                exit_code=exit_code,
+                stdout=stdout,
+                stderr=stderr,
+                duration=duration,
+                passed=False,
+                cpu_time=cpu_time,
+                timestamp=self._epoch,
+                offset_ns=end_ns - self._epoch_ns,
+                config=config
+            ))
+        
+        return results
+    
+    def _libtest_json_supported(self) -> bool:
+        """Check once whether libtest's unstable JSON output can be used."""
+        if self._libtest_json is None:
+            if self._base_env.get('RUSTC_BOOTSTRAP') == '1':
+                self._libtest_json = True
+            else:
+                exit_code, stdout, _ = self.run_command(['rustc', '-vV'], timeout=30)
+                release = next((line for line in stdout.splitlines() if line.startswith('release:')), '')
+                self._libtest_json = exit_code == 0 and ('nightly' in release or 'dev' in release)
+        return self._libtest_json
+    
     def run_cargo_example(self,
                          example_name: str,
                          args: Optional[List[str]] = None,
@@ -176,7 +745,7 @@ class TestExecutor:
         Returns:
             TestResult object
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Build cargo command
         cmd = ['cargo', 'run', '--example', example_name]
@@ -186,9 +755,10 @@ class TestExecutor:
             cmd.extend(args)
         
         # Execute command
-        exit_code, stdout, stderr = self.run_command(cmd, env=env, timeout=timeout)
+        exit_code, stdout, stderr, cpu_time = self._run_process(cmd, env, timeout)
         
-        duration = time.time() - start_time
+        end_ns = time.perf_counter_ns()
+        duration = (end_ns - start_ns) / 1e9
         
         return TestResult(
             name=f"example_{example_name}",
@@ -198,6 +768,9 @@ class TestExecutor:
             stderr=stderr,
             duration=duration,
             passed=(exit_code == 0),
+            cpu_time=cpu_time,
+            timestamp=self._epoch,
+            offset_ns=end_ns - self._epoch_ns,
             config={'args': args, 'env': env}
         )
     
@@ -206,7 +779,8 @@ class TestExecutor:
                           cmd: List[str],
                           env: Optional[Dict[str, str]] = None,
                           timeout: Optional[int] = 300,
-                          cwd: Optional[Path] = None) -> TestResult:
+                          cwd: Optional[Path] = None,
+                          cpu_affinity: Optional[Iterable[int]] = None) -> TestResult:
         """
         Run a custom command.
         
@@ -216,15 +790,17 @@ class TestExecutor:
             env: Optional environment variables
             timeout: Timeout in seconds
             cwd: Optional working directory
+            cpu_affinity: Optional CPUs to pin the command to
         
         Returns:
             TestResult object
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        exit_code, stdout, stderr = self.run_command(cmd, env=env, timeout=timeout, cwd=cwd)
+        exit_code, stdout, stderr, cpu_time = self._run_process(cmd, env, timeout, cwd, cpu_affinity)
         
-        duration = time.time() - start_time
+        end_ns = time.perf_counter_ns()
+        duration = (end_ns - start_ns) / 1e9
         
         return TestResult(
             name=name,
@@ -234,9 +810,118 @@ class TestExecutor:
             stderr=stderr,
             duration=duration,
             passed=(exit_code == 0),
+            cpu_time=cpu_time,
+            timestamp=self._epoch,
+            offset_ns=end_ns - self._epoch_ns,
             config={'cmd': cmd, 'env': env}
         )
     
+    def build_cargo_tests(self,
+                          features: Optional[List[str]] = None,
+                          env: Optional[Dict[str, str]] = None,
+                          timeout: Optional[int] = 600) -> Optional[List[str]]:
+        """
+        Build the cargo test binaries without running them.
+        
+        Args:
+            features: Optional list of cargo features to enable
+            env: Optional environment variables
+            timeout: Timeout in seconds
+        
+        Returns:
+            Paths of the built test executables, or None if the build failed
+        """
+        cmd = ['cargo', 'test', '--no-run', '--message-format=json']
+        
+        if features:
+            cmd.extend(['--features', ','.join(features)])
+        
+        exit_code, stdout, stderr = self.run_command(cmd, env=env, timeout=timeout)
+        if exit_code != 0:
+            return None
+        
+        executables = []
+        for line in stdout.splitlines():
+            if '"compiler-artifact"' not in line:
+                continue
+            try:
+                message = json_loads(line)
+            except ValueError:
+                continue
+            if message.get('profile', {}).get('test') and message.get('executable'):
+                executables.append(message['executable'])
+        
+        return executables or None
+    
+    def run_test_binaries(self,
+                          test_name: str,
+                          executables: List[str],
+                          test_filter: Optional[str] = None,
+                          env: Optional[Dict[str, str]] = None,
+                          timeout: Optional[int] = 300,
+                          cpu_affinity: Optional[Iterable[int]] = None) -> TestResult:
+        """
+        Run prebuilt cargo test binaries, as ``cargo test`` would.
+        
+        Skips cargo's own startup and build check, so configurations that
+        only differ in environment can share one build.
+        
+        Args:
+            test_name: Name for this test run
+            executables: Test binaries from build_cargo_tests()
+            test_filter: Optional filter for test names
+            env: Optional environment variables
+            timeout: Timeout in seconds for all binaries together
+            cpu_affinity: Optional CPUs to pin the binaries to
+        
+        Returns:
+            TestResult object
+        """
+        start_ns = time.perf_counter_ns()
+        deadline = None if timeout is None else start_ns + int(timeout * 1e9)
+        
+        # cargo test sets this for the binaries it runs
+        run_env = {'CARGO_MANIFEST_DIR': str(self.project_root), **(env or {})}
+        
+        exit_code = 0
+        cpu_time = 0.0
+        stdout_parts = []
+        stderr_parts = []
+        for executable in executables:
+            cmd = [executable]
+            if test_filter:
+                cmd.append(test_filter)
+            cmd.append('--nocapture')
+            
+            remaining = None if deadline is None else max(deadline - time.perf_counter_ns(), 0) / 1e9
+            code, stdout, stderr, cpu = self._run_process(cmd, run_env, remaining, cpu_affinity=cpu_affinity)
+            cpu_time += cpu
+            stdout_parts.append(stdout)
+            stderr_parts.append(stderr)
+            
+            if code != 0:
+                exit_code = exit_code or code
+                if code == -1:
+                    # Timed out or could not start; the budget is spent
+                    break
+        
+        end_ns = time.perf_counter_ns()
+        duration = (end_ns - start_ns) / 1e9
+        
+        return TestResult(
+            name=test_name,
+            category='cargo_test',
+            exit_code=exit_code,
+            stdout=''.join(stdout_parts),
+            stderr=''.join(stderr_parts),
+            duration=duration,
+            passed=(exit_code == 0),
+            cpu_time=cpu_time,
+            timestamp=self._epoch,
+            offset_ns=end_ns - self._epoch_ns,
+            config={'filter': test_filter, 'executables': executables, 'env': env}
+        )
+    
     def run_test_batch(self, tests: List[Dict[str, Any]], parallel: bool = True) -> List[TestResult]:
         """
         Run a batch of tests, optionally in parallel.
@@ -248,54 +933,142 @@ class TestExecutor:
         Returns:
             List of TestResult objects
         """
-        results = []
+        # Tests without their own affinity stay off CPUs other tests in the
+        # batch are pinned to (e.g. benchmarks), while any remain
+        pinned = set()
+        for test_spec in tests:
+            pinned.update(test_spec.get('cpu_affinity') or ())
+        if pinned and parallel:
+            rest = _available_cpus() - pinned
+            if rest:
+                tests = [spec if spec.get('cpu_affinity') else {**spec, 'cpu_affinity': rest}
+                         for spec in tests]
+        
+        # Results are stored by position, so they come back in the order
+        # the tests were given whatever order they finish in
+        results: List[Optional[TestResult]] = [None] * len(tests)
         
         if not parallel:
             # Sequential execution
-            for test_spec in tests:
+            for i, test_spec in enumerate(tests):
                 result = self._execute_single_test(test_spec)
-                results.append(result)
-                self._print_progress(test_spec['name'], result.passed)
+                results[i] = result
+                self._print_progress(test_spec['name'], _all_passed(result))
         else:
-            # Parallel execution
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_test = {
-                    executor.submit(self._execute_single_test, test_spec): test_spec
-                    for test_spec in tests
-                }
-                
-                for future in as_completed(future_to_test):
-                    test_spec = future_to_test[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        self._print_progress(test_spec['name'], result.passed)
-                    except Exception as e:
-                        results.append(TestResult(
-                            name=test_spec['name'],
-                            category=test_spec.get('type', 'unknown'),
-                            exit_code=-1,
-                            stdout="",
-                            stderr=str(e),
-                            duration=0,
-                            passed=False,
-                            error=str(e)
-                        ))
-                        self._print_progress(test_spec['name'], False, error=True)
+            # Longest expected tests first (LPT) so a long test submitted
+            # last cannot leave every other worker idle while it runs
+            history = self._get_duration_history()
+            order = sorted(range(len(tests)),
+                           key=lambda i: history.get(tests[i]['name'], tests[i].get('timeout') or 300),
+                           reverse=True)
+            
+            # Parallel execution on the shared pool
+            executor = self._get_pool()
+            future_to_index = {
+                executor.submit(self._execute_single_test, tests[i]): i
+                for i in order
+            }
+            
+            for future in as_completed(future_to_index):
+                i = future_to_index[future]
+                test_spec = tests[i]
+                try:
+                    result = future.result()
+                    results[i] = result
+                    self._print_progress(test_spec['name'], _all_passed(result))
+                except Exception as e:
+                    results[i] = TestResult(
+                        name=test_spec['name'],
+                        category=test_spec.get('type', 'unknown'),
+                        exit_code=-1,
+                        stdout="",
+                        stderr=str(e),
+                        duration=0,
+                        passed=False,
+                        error=str(e),
+                        timestamp=self._epoch,
+                        offset_ns=time.perf_counter_ns() - self._epoch_ns
+                    )
+                    self._print_progress(test_spec['name'], False, error=True)
+            
+        # Per-test-case specs contribute all of their results, in place;
+        # run_cargo_test_cases records their run's duration itself
+        flat: List[TestResult] = []
+        durations: Dict[str, float] = {}
+        for result in results:
+            if isinstance(result, list):
+                flat.extend(result)
+            else:
+                flat.append(result)
+                durations[result.name] = result.duration
         
-        return results
+        if parallel:
+            history.update(durations)
+        
+        # Keep the batch's progress ahead of whatever the caller prints next
+        self._flush_progress()
+        return flat
     
-    def _execute_single_test(self, test_spec: Dict[str, Any]) -> TestResult:
-        """Execute a single test based on specification."""
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool shared by all parallel batches, creating it once.
+        
+        Threads are only started as tests are submitted, up to max_workers,
+        and are reused by later batches until cleanup().
+        """
+        if self._pool is None:
+            with self._active_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='test-worker')
+        return self._pool
+    
+    def _get_duration_history(self) -> Dict[str, float]:
+        """
+        Get observed test durations by name, used to order parallel batches.
+        
+        Seeded on first use from the most recent JSON report in
+        ``project_root/test-reports`` and updated after every parallel batch.
+        """
+        if self._duration_history is None:
+            self._duration_history = _load_duration_history(self.project_root / 'test-reports')
+        return self._duration_history
+    
+    def _execute_single_test(self, test_spec: Dict[str, Any]) -> Union[TestResult, List[TestResult]]:
+        """
+        Execute a single test based on specification.
+        
+        Returns a list of per-test-case results for 'cargo_test_cases'
+        specs, and a single TestResult otherwise.
+        """
         test_type = test_spec.get('type', 'cargo_test')
         
-        if test_type == 'cargo_test':
+        if test_type == 'cargo_test_cases':
+            return self.run_cargo_test_cases(
+                test_name=test_spec['name'],
+                test_filter=test_spec.get('filter'),
+                features=test_spec.get('features'),
+                env=test_spec.get('env'),
+                timeout=test_spec.get('timeout', 300),
+                cpu_affinity=test_spec.get('cpu_affinity')
+            )
+        elif test_type == 'cargo_test':
             return self.run_cargo_test(
                 test_name=test_spec['name'],
                 test_filter=test_spec.get('filter'),
                 features=test_spec.get('features'),
                 env=test_spec.get('env'),
-                timeout=test_spec.get('timeout', 300)
+                timeout=test_spec.get('timeout', 300),
+                cpu_affinity=test_spec.get('cpu_affinity')
+            )
+        elif test_type == 'test_binaries':
+            return self.run_test_binaries(
+                test_name=test_spec['name'],
+                executables=test_spec['executables'],
+                test_filter=test_spec.get('filter'),
+                env=test_spec.get('env'),
+                timeout=test_spec.get('timeout', 300),
+                cpu_affinity=test_spec.get('cpu_affinity')
             )
         elif test_type == 'example':
             return self.run_cargo_example(
@@ -310,24 +1083,76 @@ class TestExecutor:
                 cmd=test_spec['cmd'],
                 env=test_spec.get('env'),
                 timeout=test_spec.get('timeout', 300),
-                cwd=test_spec.get('cwd')
+                cwd=test_spec.get('cwd'),
+                cpu_affinity=test_spec.get('cpu_affinity')
             )
         else:
             raise ValueError(f"Unknown test type: {test_type}")
     
     def _print_progress(self, test_name: str, passed: bool, error: bool = False):
-        """Print test progress."""
-        if error:
-            status = "ERROR"
-            symbol = "✗"
-        elif passed:
-            status = "PASS"
-            symbol = "✓"
-        else:
-            status = "FAIL"
-            symbol = "✗"
+        """Queue a progress line for the output thread."""
+        if self._progress_thread is None:
+            with self._active_lock:
+                if self._progress_thread is None:
+                    self._progress_thread = threading.Thread(
+                        target=self._drain_progress, name='test-progress', daemon=True)
+                    self._progress_thread.start()
         
-        print(f"  [{symbol}] {test_name}: {status}")
+        self._progress_queue.put((test_name, passed, error))
+    
+    def _flush_progress(self):
+        """Wait until every queued progress line has been written."""
+        thread = self._progress_thread
+        if thread is None:
+            return
+        
+        written = threading.Event()
+        self._progress_queue.put(written)
+        # Never block the batch on progress output: give up if the output
+        # thread has died or stdout is stuck
+        deadline = time.monotonic() + _PROGRESS_FLUSH_TIMEOUT
+        while not written.wait(0.1):
+            if not thread.is_alive() or time.monotonic() >= deadline:
+                break
+    
+    def _drain_progress(self):
+        """
+        Write queued progress lines until a None sentinel arrives.
+        
+        Lines that arrive close together are joined into one write, so
+        completing tests never wait on the stdout lock or a slow pipe.
+        Queued Events are set once the lines before them are written.
+        """
+        progress = self._progress_queue
+        running = True
+        while running:
+            lines = []
+            written = []
+            item = progress.get()
+            deadline = time.monotonic() + _PROGRESS_LINGER
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    written.append(item)
+                    break
+                lines.append(_format_progress(*item))
+                
+                remaining = deadline - time.monotonic()
+                if len(lines) >= _PROGRESS_BATCH or remaining <= 0:
+                    break
+                try:
+                    item = progress.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            try:
+                if lines:
+                    _write_progress(lines)
+            finally:
+                for event in written:
+                    event.set()
     
     def run_with_matrix(self, 
                        test_template: Dict[str, Any],
@@ -356,14 +1181,28 @@ class TestExecutor:
     def cleanup(self):
         """Clean up any remaining processes."""
         self._shutdown = True
-        for pid, process in list(self.active_processes.items()):
-            try:
-                if platform.system() == 'Windows':
-                    process.terminate()
-                else:
-                    process.send_signal(signal.SIGTERM)
-            except:
-                pass
+        pool = self._pool
+        self._pool = None
+        if pool is not None and sys.version_info >= (3, 9):
+            # Drop queued tests so only the running ones are stopped below
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        with self._active_lock:
+            processes = list(self._active_processes.values())
+            self._active_processes.clear()
+        
+        # Escalate to SIGKILL so a test ignoring SIGTERM cannot hold up
+        # the wait below until its own timeout
+        _terminate_groups(processes, grace=1.0)
+        
+        if pool is not None:
+            pool.shutdown(wait=True)
+        
+        # Write any remaining progress and stop the output thread
+        if self._progress_thread is not None:
+            self._progress_queue.put(None)
+            self._progress_thread.join(_PROGRESS_FLUSH_TIMEOUT)
+            self._progress_thread = None
 
 
 def create_test_specifications(project_root: Path) -> List[Dict[str, Any]]:
@@ -6,24 +6,82 @@ Orchestrates test execution with different configurations and generates reports.
 
 import sys
 import os
-import json
-import subprocess
 import argparse
 import time
-import concurrent.futures
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional
-import platform
-import multiprocessing
-import yaml
+from typing import List, Dict, Any, Optional
 
 # Add lib directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
 
-from config_generator import ConfigGenerator
 from test_executor import TestExecutor, TestResult
-from report_generator import ReportGenerator
+from report_generator import ReportGenerator, TestSummary
+from json_utils import json_dumps, json_loads
+
+
+def _read_config_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a cached parsed configuration, or return None if unusable."""
+    try:
+        entry = json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _write_config_cache(cache_path: Path, entry: Dict[str, Any]):
+    """Cache a parsed configuration if JSON can represent it exactly."""
+    try:
+        data = json_dumps(entry)
+        # e.g. YAML dates or integer keys would not come back unchanged
+        if json_loads(data) != entry:
+            return
+        cache_path.parent.mkdir(exist_ok=True)
+        # Write then rename, so concurrent runs never read a partial file
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Caching is best effort, e.g. in a read-only checkout
+        pass
+
+
+# Test categories run as a single command. 'timeout_key' names the entry in
+# the config's 'timeouts' section; 'cpu_affinity' is looked up by category.
+_CATEGORIES: Dict[str, Dict[str, Any]] = {
+    'unit': {
+        'name': 'unit_tests',
+        'banner': 'unit tests',
+        'type': 'cargo_test_cases',
+        'filter': '--lib',
+        'timeout_key': 'unit',
+        'default_timeout': 300
+    },
+    'integration': {
+        'name': 'integration_tests',
+        'banner': 'integration tests',
+        'type': 'cargo_test_cases',
+        'filter': '--test *',
+        'timeout_key': 'integration',
+        'default_timeout': 600
+    },
+    'benchmarks': {
+        'name': 'benchmarks',
+        'banner': 'benchmarks',
+        'type': 'custom',
+        'cmd': ['cargo', 'bench'],
+        'timeout_key': 'performance',
+        'default_timeout': 900
+    },
+    'chaos': {
+        'name': 'chaos_tests',
+        'banner': 'chaos tests',
+        'filter': 'chaos',
+        'timeout_key': 'chaos',
+        'default_timeout': 1200
+    }
+}
+
 
 class TestRunner:
     def __init__(self, project_root: Path, config_file: Optional[Path] = None):
@@ -31,6 +89,8 @@ class TestRunner:
         self.results = []
         self.start_time = None
         self.end_time = None
+        # One stamp for every report file this run writes
+        self._report_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # Initialize library components
         self.executor = TestExecutor(project_root)
@@ -47,60 +107,74 @@ class TestRunner:
                 self.load_config(default_config)
     
     def load_config(self, config_file: Path):
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+        
+        The parsed configuration is cached as JSON in ``.cache`` under the
+        project root and reused until the YAML file changes, so YAML is only
+        parsed after an edit.
+        """
+        cache_path = self.project_root / '.cache' / f'{config_file.name}.json'
+        source = str(config_file.resolve())
+        mtime_ns = config_file.stat().st_mtime_ns
+        
+        cached = _read_config_cache(cache_path)
+        if cached and cached.get('source') == source and cached.get('mtime_ns') == mtime_ns:
+            self.config = cached.get('config')
+            return
+        
+        import yaml  # deferred: only needed when the cache is stale
+        
         with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         
-    def run_command(self, cmd: List[str], env: Dict[str, str] = None) -> Tuple[int, str, str]:
-        """Execute a command and return exit code, stdout, stderr."""
-        env_vars = os.environ.copy()
-        if env:
-            env_vars.update(env)
+        _write_config_cache(cache_path, {'source': source, 'mtime_ns': mtime_ns, 'config': self.config})
         
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=env_vars,
-            cwd=self.project_root
-        )
-        stdout, stderr = process.communicate()
-        return process.returncode, stdout.decode('utf-8'), stderr.decode('utf-8')
-    
-    def run_unit_tests(self) -> TestResult:
-        """Run unit tests."""
-        print("Running unit tests...")
-        return self.executor.run_cargo_test(
-            test_name='unit_tests',
-            test_filter='--lib',
-            timeout=self.config.get('timeouts', {}).get('unit', 300)
-        )
-    
-    def run_integration_tests(self) -> TestResult:
-        """Run integration tests."""
-        print("Running integration tests...")
-        return self.executor.run_cargo_test(
-            test_name='integration_tests',
-            test_filter='--test *',
-            timeout=self.config.get('timeouts', {}).get('integration', 600)
-        )
+    def _category_spec(self, category: str) -> Dict[str, Any]:
+        """Build the executor test specification for a category in _CATEGORIES."""
+        entry = _CATEGORIES[category]
+        spec = {
+            'name': entry['name'],
+            'type': entry.get('type', 'cargo_test'),
+            'timeout': self.config.get('timeouts', {}).get(entry['timeout_key'], entry['default_timeout']),
+            'cpu_affinity': (self.config.get('cpu_affinity') or {}).get(category)
+        }
+        if spec['type'] == 'custom':
+            spec['cmd'] = entry['cmd']
+        else:
+            spec['filter'] = entry['filter']
+        return spec
     
-    def run_benchmarks(self) -> TestResult:
-        """Run performance benchmarks."""
-        print("Running benchmarks...")
-        return self.executor.run_custom_command(
-            name='benchmarks',
-            cmd=['cargo', 'bench'],
-            timeout=self.config.get('timeouts', {}).get('performance', 900)
-        )
+    def _run_category(self, category: str) -> List[TestResult]:
+        """Run one category from _CATEGORIES, per test case where it is set up for it."""
+        print(f"Running {_CATEGORIES[category]['banner']}...")
+        spec = self._category_spec(category)
+        
+        if spec['type'] == 'custom':
+            return [self.executor.run_custom_command(
+                name=spec['name'],
+                cmd=spec['cmd'],
+                timeout=spec['timeout'],
+                cpu_affinity=spec['cpu_affinity']
+            )]
+        if spec['type'] == 'cargo_test_cases':
+            return self.executor.run_cargo_test_cases(
+                test_name=spec['name'],
+                test_filter=spec['filter'],
+                timeout=spec['timeout'],
+                cpu_affinity=spec['cpu_affinity']
+            )
+        return [self.executor.run_cargo_test(
+            test_name=spec['name'],
+            test_filter=spec['filter'],
+            timeout=spec['timeout'],
+            cpu_affinity=spec['cpu_affinity']
+        )]
     
     def run_configuration_matrix(self) -> List[TestResult]:
         """Run tests with different configuration matrices."""
         print("Running configuration matrix tests...")
         
-        # Use config generator to create matrix
-        generator = ConfigGenerator()
-        
         # Get configurations from config or use defaults
         if 'env_presets' in self.config:
             configurations = [
@@ -135,12 +209,18 @@ class TestRunner:
                 }
             ]
         
+        # Configurations only differ in environment, so build the test
+        # binaries once and run them directly for each configuration.
+        # If the build fails, each configuration reports it through cargo.
+        executables = self.executor.build_cargo_tests()
+        
         # Create test specifications
         test_specs = []
         for config in configurations:
             test_specs.append({
                 'name': f"config_matrix_{config['name']}",
-                'type': 'cargo_test',
+                'type': 'test_binaries' if executables else 'cargo_test',
+                'executables': executables,
                 'filter': 'configurations',
                 'env': config['env'],
                 'timeout': 300
@@ -149,41 +229,18 @@ class TestRunner:
         # Run tests with executor
         return self.executor.run_test_batch(test_specs, parallel=True)
     
-    def run_chaos_tests(self) -> TestResult:
-        """Run chaos engineering tests."""
-        print("Running chaos tests...")
-        return self.executor.run_cargo_test(
-            test_name='chaos_tests',
-            test_filter='chaos',
-            timeout=self.config.get('timeouts', {}).get('chaos', 1200)
-        )
-    
-    def run_parallel_tests(self, test_categories: List[str]) -> List[Dict[str, Any]]:
+    def run_parallel_tests(self, test_categories: List[str]) -> List[TestResult]:
         """Run multiple test categories in parallel."""
         print(f"Running tests in parallel: {test_categories}")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(test_categories)) as executor:
-            futures = {}
-            
-            for category in test_categories:
-                if category == 'unit':
-                    futures[executor.submit(self.run_unit_tests)] = category
-                elif category == 'integration':
-                    futures[executor.submit(self.run_integration_tests)] = category
-                elif category == 'chaos':
-                    futures[executor.submit(self.run_chaos_tests)] = category
-            
-            results = []
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    print(f"Error running {futures[future]}: {e}")
-            
-            return results
+        # One batch on the executor's pool, so the categories are scheduled
+        # together (longest first) instead of through a second thread pool
+        return self.executor.run_test_batch(
+            [self._category_spec(category) for category in test_categories if category in _CATEGORIES],
+            parallel=True
+        )
     
-    def generate_report(self) -> Dict[str, Any]:
+    def generate_report(self, summary: Optional[TestSummary] = None) -> Dict[str, Any]:
         """Generate test report using ReportGenerator."""
         total_duration = (self.end_time - self.start_time) if self.end_time else 0
         
@@ -193,23 +250,23 @@ class TestRunner:
             'config_file': str(self.config.get('name', 'default'))
         }
         
-        return self.report_generator.generate_json_report(self.results, metadata)
+        return self.report_generator.generate_json_report(self.results, metadata, summary=summary)
     
-    def save_report(self, format: str = 'json'):
+    def save_report(self, format: str = 'json', summary: Optional[TestSummary] = None):
         """Save test report to file."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._report_stamp
         
         if format == 'json':
             filename = f'report_{timestamp}.json'
-            self.report_generator.save_json_report(self.results, filename)
+            self.report_generator.save_json_report(self.results, filename, summary=summary)
         
         elif format == 'html':
             filename = f'report_{timestamp}.html'
-            self.report_generator.save_html_report(self.results, filename)
+            self.report_generator.save_html_report(self.results, filename, summary=summary)
         
         elif format == 'junit':
             filename = f'junit_{timestamp}.xml'
-            self.report_generator.save_junit_xml(self.results, filename)
+            self.report_generator.save_junit_xml(self.results, filename, summary=summary)
     
     
     def run(self, args):
@@ -219,37 +276,35 @@ class TestRunner:
         if args.parallel:
             self.results.extend(self.run_parallel_tests(['unit', 'integration', 'chaos']))
         else:
-            if args.unit or args.all:
-                self.results.append(self.run_unit_tests())
-            
-            if args.integration or args.all:
-                self.results.append(self.run_integration_tests())
-            
-            if args.benchmarks:
-                self.results.append(self.run_benchmarks())
-            
-            if args.matrix or args.all:
-                self.results.extend(self.run_configuration_matrix())
-            
-            if args.chaos or args.all:
-                self.results.append(self.run_chaos_tests())
+            selected = {
+                'unit': args.unit or args.all,
+                'integration': args.integration or args.all,
+                'benchmarks': args.benchmarks,
+                'matrix': args.matrix or args.all,
+                'chaos': args.chaos or args.all
+            }
+            for category, wanted in selected.items():
+                if not wanted:
+                    continue
+                if category == 'matrix':
+                    self.results.extend(self.run_configuration_matrix())
+                else:
+                    self.results.extend(self._run_category(category))
         
         self.end_time = time.time()
         
-        # Generate and save report
-        report = self.generate_report()
+        # Summarize once and share it with the report and every saved format
+        summary = self.report_generator.generate_summary(self.results)
+        report = self.generate_report(summary)
         
         if args.json:
-            self.save_report('json')
+            self.save_report('json', summary)
         
         if args.html:
-            self.save_report('html')
+            self.save_report('html', summary)
             
         if hasattr(args, 'junit') and args.junit:
-            self.save_report('junit')
-        
-        # Calculate summary stats
-        summary = self.report_generator.generate_summary(self.results)
+            self.save_report('junit', summary)
         
         # Print summary
         print("\n" + "="*50)
@@ -312,7 +367,12 @@ def main():
             sys.exit(1)
     
     runner = TestRunner(project_root, config_file)
-    sys.exit(runner.run(args))
+    try:
+        sys.exit(runner.run(args))
+    finally:
+        # Tests run in their own process groups, so stop any still running
+        # (e.g. after Ctrl-C) instead of leaving them orphaned
+        runner.executor.cleanup()
 
 
 if __name__ == '__main__':
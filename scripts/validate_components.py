@@ -6,32 +6,103 @@ Ensures all modules are working correctly together.
 
 import sys
 import os
+import re
+import io
+import contextlib
+import functools
 from pathlib import Path
+from typing import Optional
 
 # Add lib directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
 
-from config_generator import ConfigGenerator, create_default_matrix
+from config_generator import ConfigGenerator
 from test_executor import TestExecutor, TestResult
 from report_generator import ReportGenerator
 
+
+@functools.lru_cache(maxsize=1)
+def _find_project_root() -> Optional[Path]:
+    """Find the directory containing Cargo.toml, searched once per run."""
+    cwd = Path.cwd().resolve()
+    for directory in (cwd, *cwd.parents):
+        if os.path.isfile(os.path.join(directory, 'Cargo.toml')):
+            return directory
+    return None
+
+
+_BANNER = '=' * 60
+_HEADER = f"{_BANNER}\nDSL-RS Test Runner Component Validation\n{_BANNER}"
+
+# Matches the opening html tag in any case, without lowercasing the report
+_HTML_TAG = re.compile(r'<html', re.IGNORECASE)
+# Characters from the start of the HTML report searched for the tag and title
+_HTML_TAG_LIMIT = 512
+_HTML_TITLE_LIMIT = 4096
+
+
+# One passing and one failing result, shared by every report format check
+_REPORT_FIXTURES = (
+    TestResult(
+        name="test1",
+        category="unit",
+        exit_code=0,
+        stdout="",
+        stderr="",
+        duration=1.0,
+        passed=True
+    ),
+    TestResult(
+        name="test2",
+        category="integration",
+        exit_code=1,
+        stdout="",
+        stderr="Error",
+        duration=2.0,
+        passed=False
+    ),
+)
+
+
+def _check(condition: bool, pass_msg: str, fail_msg: Optional[str] = None):
+    """
+    Report a passing check, or raise AssertionError for a failing one.
+    
+    Unlike an assert statement this still checks under ``python -O``.
+    """
+    if not condition:
+        raise AssertionError(fail_msg or pass_msg)
+    print(f"  [PASS] {pass_msg}")
+
+
+@functools.lru_cache(maxsize=1)
+def _config_generator() -> ConfigGenerator:
+    """ConfigGenerator shared by the validators."""
+    return ConfigGenerator()
+
+
+@functools.lru_cache(maxsize=4)
+def _report_generator(project_root: Path) -> ReportGenerator:
+    """ReportGenerator shared by the validators, one per project root."""
+    return ReportGenerator(project_root)
+
+
 def validate_config_generator():
     """Validate configuration generator."""
     print("Testing ConfigGenerator...")
     
-    generator = ConfigGenerator()
+    generator = _config_generator()
     
     # Test matrix generation
-    matrix = create_default_matrix()
     configs = generator.generate_matrix({'stream_count': {'start': 1, 'stop': 3}})
     
-    assert len(configs) > 0, "Failed to generate configurations"
-    print(f"  [PASS] Generated {len(configs)} configurations")
+    _check(len(configs) > 0, f"Generated {len(configs)} configurations",
+           "Failed to generate configurations")
     
     # Test filtering
     filtered = generator.filter_matrix(configs, constraints={'stream_count': {'max': 2}})
-    assert len(filtered) <= len(configs), "Filtering failed"
-    print(f"  [PASS] Filtered to {len(filtered)} configurations")
+    _check(len(filtered) <= len(configs), f"Filtered to {len(filtered)} configurations",
+           "Filtering failed")
     
     return True
 
@@ -40,12 +111,10 @@ def validate_test_executor():
     """Validate test executor."""
     print("Testing TestExecutor...")
     
-    project_root = Path.cwd()
-    while not (project_root / 'Cargo.toml').exists():
-        if project_root.parent == project_root:
-            print("  [FAIL] Could not find project root")
-            return False
-        project_root = project_root.parent
+    project_root = _find_project_root()
+    if project_root is None:
+        print("  [FAIL] Could not find project root")
+        return False
     
     executor = TestExecutor(project_root)
     
@@ -60,14 +129,16 @@ def validate_test_executor():
         passed=True
     )
     
-    assert result.name == "validation_test", "TestResult creation failed"
-    assert result.passed == True, "TestResult passed flag incorrect"
-    print("  [PASS] TestResult created successfully")
+    _check(result.name == "validation_test", "TestResult created successfully",
+           "TestResult creation failed")
+    _check(result.passed is True, "TestResult passed flag set", "TestResult passed flag incorrect")
     
-    # Test command execution (simple echo command)
-    exit_code, stdout, stderr = executor.run_command(['echo', 'test'])
-    assert exit_code == 0, "Command execution failed"
-    print("  [PASS] Command execution working")
+    # Test command execution with a real but trivial process, so the spawn
+    # and wait path is covered; echo is a cmd.exe builtin on Windows
+    cmd = ['cmd', '/c', 'echo test'] if os.name == 'nt' else ['echo', 'test']
+    exit_code, stdout, stderr = executor.run_command(cmd)
+    _check(exit_code == 0, "Command execution working", "Command execution failed")
+    _check(stdout.strip() == 'test', "Command output captured", "Command output not captured")
     
     return True
 
@@ -76,62 +147,39 @@ def validate_report_generator():
     """Validate report generator."""
     print("Testing ReportGenerator...")
     
-    project_root = Path.cwd()
-    while not (project_root / 'Cargo.toml').exists():
-        if project_root.parent == project_root:
-            print("  [FAIL] Could not find project root")
-            return False
-        project_root = project_root.parent
-    
-    generator = ReportGenerator(project_root)
+    project_root = _find_project_root()
+    if project_root is None:
+        print("  [FAIL] Could not find project root")
+        return False
     
-    # Create test results
-    results = [
-        TestResult(
-            name="test1",
-            category="unit",
-            exit_code=0,
-            stdout="",
-            stderr="",
-            duration=1.0,
-            passed=True
-        ),
-        TestResult(
-            name="test2",
-            category="integration",
-            exit_code=1,
-            stdout="",
-            stderr="Error",
-            duration=2.0,
-            passed=False
-        )
-    ]
+    generator = _report_generator(project_root)
     
     # Generate summary
+    results = _REPORT_FIXTURES
     summary = generator.generate_summary(results)
-    assert summary.total == 2, "Summary total incorrect"
-    assert summary.passed == 1, "Summary passed count incorrect"
-    assert summary.failed == 1, "Summary failed count incorrect"
-    print(f"  [PASS] Summary generated: {summary.passed}/{summary.total} passed")
+    _check(summary.total == 2, f"Summary total: {summary.total}", "Summary total incorrect")
+    _check(summary.passed == 1, f"Summary generated: {summary.passed}/{summary.total} passed",
+           "Summary passed count incorrect")
+    _check(summary.failed == 1, f"Summary failed: {summary.failed}", "Summary failed count incorrect")
     
     # Generate JSON report
     report = generator.generate_json_report(results)
-    assert 'timestamp' in report, "JSON report missing timestamp"
-    assert 'summary' in report, "JSON report missing summary"
-    assert 'results' in report, "JSON report missing results"
-    print("  [PASS] JSON report generated successfully")
+    _check('timestamp' in report, "JSON report has timestamp", "JSON report missing timestamp")
+    _check('summary' in report, "JSON report has summary", "JSON report missing summary")
+    _check('results' in report, "JSON report generated successfully", "JSON report missing results")
     
     # Generate HTML report
     html = generator.generate_html_report(results)
-    assert '<html' in html.lower(), "HTML report missing html tag"
-    assert 'DSL-RS Test Report' in html, "HTML report missing title"
-    print("  [PASS] HTML report generated successfully")
+    # Both belong in the document head, so only its start is searched
+    _check(_HTML_TAG.search(html, 0, _HTML_TAG_LIMIT) is not None, "HTML report has html tag",
+           "HTML report missing html tag")
+    _check(html.find('DSL-RS Test Report', 0, _HTML_TITLE_LIMIT) >= 0, "HTML report generated successfully",
+           "HTML report missing title")
     
     # Generate JUnit XML
     xml = generator.generate_junit_xml(results)
-    assert '<?xml' in xml, "JUnit XML missing declaration"
-    assert '<testsuites' in xml, "JUnit XML missing testsuites"
-    print("  [PASS] JUnit XML generated successfully")
+    _check('<?xml' in xml, "JUnit XML has declaration", "JUnit XML missing declaration")
+    _check('<testsuites' in xml, "JUnit XML generated successfully", "JUnit XML missing testsuites")
     
     return True
 
@@ -140,100 +188,74 @@ def validate_integration():
     """Validate all components work together."""
     print("Testing Integration...")
     
-    project_root = Path.cwd()
-    while not (project_root / 'Cargo.toml').exists():
-        if project_root.parent == project_root:
-            print("  [FAIL] Could not find project root")
-            return False
-        project_root = project_root.parent
+    project_root = _find_project_root()
+    if project_root is None:
+        print("  [FAIL] Could not find project root")
+        return False
     
     # Create components
-    config_gen = ConfigGenerator()
+    config_gen = _config_generator()
     executor = TestExecutor(project_root)
-    report_gen = ReportGenerator(project_root)
+    report_gen = _report_generator(project_root)
     
     # Generate a small configuration matrix
     configs = config_gen.generate_matrix({'test_level': ['quick', 'full']})
     
-    # Create test specifications
-    test_specs = []
-    for i, config in enumerate(configs):
-        test_specs.append({
-            'name': f'integration_test_{i}',
-            'type': 'custom',
-            'cmd': ['echo', f'Test {i}'],
-            'env': config
-        })
-    
-    # Execute tests
-    results = []
-    for spec in test_specs:
-        # Simulate test execution
-        result = TestResult(
-            name=spec['name'],
+    # Simulate executing one custom test per configuration
+    results = [
+        TestResult(
+            name=f'integration_test_{i}',
             category='integration',
             exit_code=0,
-            stdout=f"Output for {spec['name']}",
+            stdout=f"Output for integration_test_{i}",
             stderr="",
             duration=0.1,
             passed=True,
-            config=spec['env']
+            config=config
         )
-        results.append(result)
+        for i, config in enumerate(configs)
+    ]
     
     # Generate report
     report = report_gen.generate_json_report(results)
     
-    assert len(results) == len(configs), "Result count mismatch"
-    assert report['summary']['total'] == len(results), "Report summary incorrect"
-    
-    print(f"  [PASS] Integration test completed: {len(results)} tests executed")
+    _check(len(results) == len(configs), f"Built {len(results)} results", "Result count mismatch")
+    _check(report['summary']['total'] == len(results),
+           f"Integration test completed: {len(results)} tests executed", "Report summary incorrect")
     
     return True
 
 
+# Validators run by main(), with the label used in failure messages
+_VALIDATORS = (
+    ('ConfigGenerator', validate_config_generator),
+    ('TestExecutor', validate_test_executor),
+    ('ReportGenerator', validate_report_generator),
+    ('Integration', validate_integration),
+)
+
+
 def main():
     """Run all validation tests."""
-    print("="*60)
-    print("DSL-RS Test Runner Component Validation")
-    print("="*60)
+    print(_HEADER)
     
     all_passed = True
     
-    # Test each component
-    try:
-        if not validate_config_generator():
-            all_passed = False
-            print("  [FAIL] ConfigGenerator validation failed")
-    except Exception as e:
-        print(f"  [FAIL] ConfigGenerator error: {e}")
-        all_passed = False
-    
-    try:
-        if not validate_test_executor():
-            all_passed = False
-            print("  [FAIL] TestExecutor validation failed")
-    except Exception as e:
-        print(f"  [FAIL] TestExecutor error: {e}")
-        all_passed = False
-    
-    try:
-        if not validate_report_generator():
-            all_passed = False
-            print("  [FAIL] ReportGenerator validation failed")
-    except Exception as e:
-        print(f"  [FAIL] ReportGenerator error: {e}")
-        all_passed = False
-    
-    try:
-        if not validate_integration():
+    # Test each component, collecting its output (including anything the
+    # components print) and writing it in one piece
+    for label, validate in _VALIDATORS:
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                if not validate():
+                    all_passed = False
+                    print(f"  [FAIL] {label} validation failed")
+        except Exception as e:
+            print(f"  [FAIL] {label} error: {e}", file=output)
             all_passed = False
-            print("  [FAIL] Integration validation failed")
-    except Exception as e:
-        print(f"  [FAIL] Integration error: {e}")
-        all_passed = False
+        sys.stdout.write(output.getvalue())
     
-    print("="*60)
+    print(_BANNER)
     if all_passed:
         print("[SUCCESS] All validations passed!")
         print("The test runner components are working correctly.")